@@ -0,0 +1,118 @@
+"""Scene restore benchmarks with and without the /batch endpoint.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_commands --latency 0.02 --output bench_output.txt
+
+Each result is written as one JSON object per line.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import TextIO
+
+from custom_components.music_cast.const import (
+    CONF_RATE_LIMIT_DEVICE,
+    CONF_RATE_LIMIT_SETTINGS,
+    CONF_RATE_LIMIT_STREAMING,
+    CONF_RATE_LIMIT_VOLUME,
+    RATE_LIMIT_MAX,
+)
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+
+# Restores run back to back, faster than the default rate limits allow
+UNTHROTTLED_OPTIONS = {
+    CONF_RATE_LIMIT_STREAMING: RATE_LIMIT_MAX,
+    CONF_RATE_LIMIT_VOLUME: RATE_LIMIT_MAX,
+    CONF_RATE_LIMIT_SETTINGS: RATE_LIMIT_MAX,
+    CONF_RATE_LIMIT_DEVICE: RATE_LIMIT_MAX,
+}
+
+
+def _change_server_state(server: FakeMusicCastServer, round_: int) -> None:
+    """Move every setting of a scene away from its saved value."""
+    auto_detection = server.status["auto_detection"]
+    auto_detection["threshold"] = 0.5 + round_ % 10 / 100
+    auto_detection["silence_timeout"] = 60.0 + round_ % 10
+    auto_detection["enabled"] = not auto_detection["enabled"]
+    server.status["cast_device"]["volume_level"] = 0.9
+    server.status["cast_device"]["is_muted"] = True
+
+
+async def bench_restore(args: argparse.Namespace, batch: bool, stream: TextIO) -> None:
+    """Measure the time and requests taken to restore a scene."""
+    server = FakeMusicCastServer(
+        audio_devices=args.audio_devices,
+        cast_devices=args.cast_devices,
+        latency=args.latency,
+        batch=batch,
+        seed=args.seed,
+    )
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(hass, server, 1, options=UNTHROTTLED_OPTIONS)
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+            scene = await coordinator.async_snapshot_scene("bench")
+
+            samples = []
+            requests = 0
+            failures = 0
+            for round_ in range(args.rounds):
+                _change_server_state(server, round_)
+                await coordinator.async_refresh()
+
+                server.reset_counters()
+                start = time.perf_counter()
+                failures += not await coordinator.async_restore_scene(scene)
+                samples.append(time.perf_counter() - start)
+                requests += server.request_count
+
+            emit({
+                "benchmark": "restore_scene",
+                "batch": batch,
+                "latency_ms": args.latency * 1000,
+                "rounds": args.rounds,
+                "failed_restores": failures,
+                "requests_per_restore": requests / args.rounds,
+                **summarize(samples),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    for batch in (False, True):
+        await bench_restore(args, batch, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--audio-devices", type=int, default=2)
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every request")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Failover benchmark with a primary and a standby fake server.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_failover --rounds 5 --output bench_output.txt
+
+Each round stops the primary, measures the refresh that fails over to the
+standby and the time until the last settings are replayed there, then
+restarts the primary and fails back. Each result is written as one JSON
+object per line.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import TextIO
+
+from custom_components.music_cast.const import CONF_STANDBY_SERVERS
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+REPLAY_VOLUME = 0.3
+
+
+async def _async_wait_for(predicate, timeout: float) -> bool:
+    """Poll `predicate` until it is true or `timeout` expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.005)
+    return True
+
+
+async def bench_failover(args: argparse.Namespace, stream: TextIO) -> None:
+    """Measure failover and replay time."""
+    primary = FakeMusicCastServer(cast_devices=args.cast_devices, latency=args.latency)
+    standby = FakeMusicCastServer(cast_devices=args.cast_devices, latency=args.latency)
+    await primary.start()
+    await standby.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(
+                hass, primary, 1, options={CONF_STANDBY_SERVERS: f"127.0.0.1:{standby.port}"}
+            )
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            failover_samples = []
+            replay_samples = []
+            failed_failovers = 0
+            for _ in range(args.rounds):
+                primary.status["cast_device"]["volume_level"] = REPLAY_VOLUME
+                standby.status["cast_device"]["volume_level"] = 0.9
+                await coordinator.async_refresh()
+
+                port = primary.port
+                await primary.stop()
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                failover_samples.append(time.perf_counter() - start)
+                failed_failovers += not (
+                    coordinator.last_update_success and coordinator.base_url == standby.url
+                )
+
+                if await _async_wait_for(
+                    lambda: standby.status["cast_device"]["volume_level"] == REPLAY_VOLUME,
+                    args.timeout,
+                ):
+                    replay_samples.append(time.perf_counter() - start)
+
+                # Fail back on the next health check
+                await primary.start(port)
+                coordinator._last_health_check = 0.0
+                await coordinator.async_refresh()
+                await hass.async_block_till_done()
+
+            emit({
+                "benchmark": "failover",
+                "latency_ms": args.latency * 1000,
+                "rounds": args.rounds,
+                "failed_failovers": failed_failovers,
+                "replayed": len(replay_samples),
+                "failovers": coordinator.stats.failovers,
+                "failover": summarize(failover_samples),
+                "replay": summarize(replay_samples),
+            }, stream)
+    finally:
+        await primary.stop()
+        await standby.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for the replay")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(bench_failover(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare JSON decode cost of /cast-devices payloads across sizes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_json_decode
+
+Each result is printed as one JSON object per line.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+
+from homeassistant.util.json import json_loads_object
+
+from .payloads import make_cast_devices
+
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+
+
+def bench_decode(size: int, number: int) -> dict:
+    """Time stdlib and HA JSON decoding for a payload with `size` devices."""
+    body = json.dumps(make_cast_devices(size)).encode()
+    text = body.decode()
+
+    stdlib = min(timeit.repeat(lambda: json.loads(text), number=number, repeat=5)) / number
+    fast = min(timeit.repeat(lambda: json_loads_object(body), number=number, repeat=5)) / number
+
+    return {
+        "benchmark": "json_decode",
+        "cast_devices": size,
+        "payload_bytes": len(body),
+        "stdlib_us": round(stdlib * 1e6, 2),
+        "json_loads_us": round(fast * 1e6, 2),
+        "speedup": round(stdlib / fast, 2),
+    }
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        sys.stdout.write(json.dumps(bench_decode(size, args.number)) + "\n")
+
+
+if __name__ == "__main__":
+    main()
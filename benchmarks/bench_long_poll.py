@@ -0,0 +1,126 @@
+"""Compare status update latency and request volume of polling and long-poll.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_long_poll --changes 5 --output bench_output.txt
+
+Each change flips `streaming` on the fake server and waits until the
+coordinator sees it. Each result is written as one JSON object per line.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import TextIO
+
+from custom_components.music_cast.const import (
+    CONF_LONG_POLL,
+    CONF_SCAN_INTERVAL,
+    SCAN_INTERVAL_MIN,
+)
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+
+async def _async_wait_for_streaming(coordinator, streaming: bool, timeout: float) -> bool:
+    """Wait for coordinator data with `streaming`.
+
+    Listens for updates instead of using wait_for_state, which would speed
+    up polling.
+    """
+    seen = asyncio.Event()
+
+    def check() -> None:
+        if (coordinator.data or {}).get("status", {}).get("streaming") == streaming:
+            seen.set()
+
+    check()
+    remove_listener = coordinator.async_add_listener(check)
+    try:
+        await asyncio.wait_for(seen.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        remove_listener()
+
+
+async def bench_updates(args: argparse.Namespace, long_poll: bool, stream: TextIO) -> None:
+    """Measure the time from a server change to new coordinator data."""
+    server = FakeMusicCastServer(cast_devices=args.cast_devices, latency=args.latency)
+    rand = random.Random(args.seed)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(
+                hass,
+                server,
+                1,
+                options={CONF_SCAN_INTERVAL: SCAN_INTERVAL_MIN, CONF_LONG_POLL: long_poll},
+            )
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            server.reset_counters()
+            start_all = time.perf_counter()
+            samples = []
+            missed = 0
+            for _ in range(args.changes):
+                await asyncio.sleep(rand.uniform(0, SCAN_INTERVAL_MIN))
+                streaming = not server.status["streaming"]
+                server.status["streaming"] = streaming
+                server.notify_status_changed()
+
+                start = time.perf_counter()
+                if await _async_wait_for_streaming(coordinator, streaming, args.timeout):
+                    samples.append(time.perf_counter() - start)
+                else:
+                    missed += 1
+            elapsed = time.perf_counter() - start_all
+
+            emit({
+                "benchmark": "status_updates",
+                "long_poll": long_poll,
+                "long_poll_active": coordinator.long_poll_active,
+                "latency_ms": args.latency * 1000,
+                "changes": args.changes,
+                "missed_changes": missed,
+                "requests_per_minute": round(server.request_count * 60 / elapsed, 2),
+                **summarize(samples),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    for long_poll in (False, True):
+        await bench_updates(args, long_poll, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changes", type=int, default=5)
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for a change")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Memory cost of config entries and cast devices, measured with tracemalloc.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory --entries 1 10 100 --cast-devices 10 200 --output bench_output.txt
+
+Memory is traced from before the entries are set up until their first
+refresh completed, after a garbage collection, so it covers coordinators,
+entities, states and coordinator data. The fake server is started before
+tracing and its payloads are not counted. The cast device inventories are
+sized separately, and the rest is reported as the entity footprint, which
+also covers coordinators and registries. Each result is written as one
+JSON object per line.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from typing import Any, Dict, Set, TextIO
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+)
+
+
+def _traced_bytes() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _deep_size(obj: Any, seen: Set[int]) -> int:
+    """Return the size of an object and the objects it references, each once."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif dataclasses.is_dataclass(obj):
+        size += sum(_deep_size(getattr(obj, field.name), seen) for field in dataclasses.fields(obj))
+    return size
+
+
+async def measure(args: argparse.Namespace, entries_count: int, cast_devices: int) -> Dict[str, int]:
+    """Return the bytes retained by `entries_count` entries and their inventories."""
+    server = FakeMusicCastServer(audio_devices=args.audio_devices, cast_devices=cast_devices)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            tracemalloc.start(args.frames)
+            try:
+                baseline = _traced_bytes()
+                entries = await async_setup_entries(hass, server, entries_count)
+                await async_wait_for_first_refresh(hass, entries)
+                await hass.async_block_till_done()
+                retained = _traced_bytes() - baseline
+                seen: Set[int] = set()
+                inventory = sum(
+                    _deep_size(get_coordinator(hass, entry).cast_devices_by_uuid, seen)
+                    for entry in entries
+                )
+
+                top = []
+                if args.top:
+                    snapshot = tracemalloc.take_snapshot().filter_traces(
+                        [tracemalloc.Filter(False, tracemalloc.__file__)]
+                    )
+                    top = [
+                        {"site": str(stat.traceback), "bytes": stat.size}
+                        for stat in snapshot.statistics("lineno")[:args.top]
+                    ]
+            finally:
+                tracemalloc.stop()
+
+            return {
+                "retained_bytes": retained,
+                "inventory_bytes": inventory,
+                "entity_bytes": retained - inventory,
+                "entities": len(hass.states.async_all()),
+                "top": top,
+            }
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    # Platforms imported and caches filled by the first setup in the
+    # process would otherwise be counted against the first measurement
+    await measure(args, 1, min(args.cast_devices))
+    for entries_count in args.entries:
+        results = {}
+        for cast_devices in args.cast_devices:
+            result = results[cast_devices] = await measure(args, entries_count, cast_devices)
+            emit({
+                "benchmark": "memory",
+                "entries": entries_count,
+                "cast_devices": cast_devices,
+                "entities": result["entities"],
+                "retained_bytes": result["retained_bytes"],
+                "inventory_bytes": result["inventory_bytes"],
+                "entity_bytes": result["entity_bytes"],
+                "bytes_per_entry": round(result["retained_bytes"] / entries_count),
+                "bytes_per_entity": round(result["entity_bytes"] / result["entities"]),
+                **({"top": result["top"]} if result["top"] else {}),
+            }, stream)
+
+        if len(results) > 1:
+            # Differences between two inventory sizes at the same entry
+            # count, per entry and added cast device
+            fewest, most = min(results), max(results)
+            devices_added = (most - fewest) * entries_count
+            per_device = {
+                key: round((results[most][key] - results[fewest][key]) / devices_added)
+                for key in ("retained_bytes", "inventory_bytes", "entity_bytes")
+            }
+            emit({
+                "benchmark": "memory_per_cast_device",
+                "entries": entries_count,
+                "cast_devices": [fewest, most],
+                "bytes_per_cast_device": per_device["retained_bytes"],
+                "inventory_bytes_per_cast_device": per_device["inventory_bytes"],
+                "entity_bytes_per_cast_device": per_device["entity_bytes"],
+            }, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--cast-devices", type=int, nargs="+", default=[10, 200])
+    parser.add_argument("--audio-devices", type=int, default=2)
+    parser.add_argument("--frames", type=int, default=1, help="Traceback frames stored per allocation")
+    parser.add_argument("--top", type=int, default=0, help="Report the N largest allocation sites")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Refresh and setup benchmarks against the fake MusicCast server.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_refresh --entries 1 10 100 --output bench_output.txt
+
+Each result is written as one JSON object per line.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any, Dict, TextIO
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    count_state_writes,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+
+def _make_server(args: argparse.Namespace) -> FakeMusicCastServer:
+    return FakeMusicCastServer(
+        audio_devices=args.audio_devices,
+        cast_devices=args.cast_devices,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+
+
+def _server_params(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "audio_devices": args.audio_devices,
+        "cast_devices": args.cast_devices,
+        "latency_ms": args.latency * 1000,
+        "jitter_ms": args.jitter * 1000,
+        "failure_rate": args.failure_rate,
+    }
+
+
+async def bench_refresh(args: argparse.Namespace, stream: TextIO) -> None:
+    """Measure latency, requests and state writes of coordinator refreshes."""
+    server = _make_server(args)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(hass, server, 1)
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            server.reset_counters()
+            samples = []
+            failures = 0
+            with count_state_writes() as counter:
+                for _ in range(args.refreshes):
+                    start = time.perf_counter()
+                    await coordinator.async_refresh()
+                    await hass.async_block_till_done()
+                    samples.append(time.perf_counter() - start)
+                    failures += not coordinator.last_update_success
+
+            emit({
+                "benchmark": "refresh",
+                **_server_params(args),
+                "refreshes": args.refreshes,
+                "failed_refreshes": failures,
+                "requests_per_refresh": server.request_count / args.refreshes,
+                "bytes_per_refresh": server.bytes_sent / args.refreshes,
+                "state_writes_per_refresh": counter["writes"] / args.refreshes,
+                **summarize(samples),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def bench_setup(args: argparse.Namespace, entries: int, stream: TextIO) -> None:
+    """Measure the time to set up `entries` config entries."""
+    server = _make_server(args)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            with count_state_writes() as counter:
+                start = time.perf_counter()
+                config_entries = await async_setup_entries(hass, server, entries)
+                elapsed = time.perf_counter() - start
+                loaded = await async_wait_for_first_refresh(hass, config_entries)
+                first_data = time.perf_counter() - start
+
+            emit({
+                "benchmark": "setup",
+                **_server_params(args),
+                "entries": entries,
+                "setup_ms": round(elapsed * 1000, 3),
+                "setup_ms_per_entry": round(elapsed * 1000 / entries, 3),
+                "first_data_ms": round(first_data * 1000, 3) if loaded else None,
+                "requests": server.request_count,
+                "state_writes": counter["writes"],
+                "entities": len(hass.states.async_all()),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    await bench_refresh(args, stream)
+    for entries in args.entries:
+        await bench_setup(args, entries, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--refreshes", type=int, default=50)
+    parser.add_argument("--audio-devices", type=int, default=2)
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds added to the latency")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Run the integration against recorded server traffic.
+
+Run from the repository root with a recording made with the Record Server
+Traffic option:
+
+    python -m benchmarks.bench_replay traffic_<entry id>.jsonl --speed 10 --output bench_output.txt
+
+The recording is replayed once by `ReplayServer` while one config entry
+polls it at the recorded scan interval divided by the speed. The result,
+written as one JSON object per line, shows how the integration handled the
+traffic: refreshes, failures, requests the recording could not answer and
+entity state changes.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import TextIO
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+
+from custom_components.music_cast.const import CONF_LONG_POLL, CONF_SCAN_INTERVAL
+
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+)
+from .replay_server import ReplayServer, load_recording
+
+
+async def bench_replay(args: argparse.Namespace, stream: TextIO) -> None:
+    """Replay a recording and report how the integration handled it."""
+    server = ReplayServer(load_recording(args.recording, args.server), speed=args.speed)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            state_changes = 0
+
+            @callback
+            def count_state_change(event: Event) -> None:
+                nonlocal state_changes
+                state_changes += 1
+
+            start = time.perf_counter()
+            (entry,) = await async_setup_entries(
+                hass,
+                server,
+                1,
+                options={
+                    CONF_SCAN_INTERVAL: args.scan_interval / args.speed,
+                    CONF_LONG_POLL: args.long_poll,
+                },
+            )
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            remove_listener = hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+            await asyncio.sleep(max(0.0, server.duration - (time.perf_counter() - start)))
+            await hass.async_block_till_done()
+            remove_listener()
+
+            stats = coordinator.stats
+            emit({
+                "benchmark": "replay",
+                "speed": args.speed,
+                "recorded_seconds": round(server.end_time - server.start_time, 3),
+                "requests": server.request_count,
+                "unmatched_requests": server.unmatched,
+                "refreshes": stats.refresh_count,
+                "failed_refreshes": stats.refresh_failures,
+                "mean_refresh_ms": round(
+                    stats.total_refresh_duration / stats.refresh_count * 1000, 3
+                ) if stats.refresh_count else None,
+                "request_errors": dict(stats.request_errors),
+                "state_changes": state_changes,
+                "last_error": stats.last_error,
+            }, stream)
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="+", help="Recording files")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, 1 being as recorded")
+    parser.add_argument("--scan-interval", type=float, default=30.0, help="Scan interval of the recorded entry")
+    parser.add_argument("--long-poll", action="store_true", help="Enable long-poll status updates")
+    parser.add_argument("--server", type=int, default=0, help="Position of the recorded server, 0 being the primary")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(bench_replay(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Import and setup time of the integration.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --entries 1 100 --output bench_output.txt
+
+Import time is measured in fresh interpreters with Home Assistant core
+already imported, so only the integration's own modules are counted. Setup
+is measured with every entity enabled and again after disabling every
+entity outside the media player platform. Each result is written as one
+JSON object per line.
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from typing import List, TextIO
+
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.music_cast import PLATFORMS
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+import homeassistant.core, homeassistant.helpers.entity_platform, homeassistant.helpers.update_coordinator
+timings = {}
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    importlib.import_module(name)
+    timings[name] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+MODULES = ["custom_components.music_cast"] + [
+    f"custom_components.music_cast.{platform}" for platform in PLATFORMS
+]
+
+
+def bench_import(args: argparse.Namespace, stream: TextIO) -> None:
+    """Measure module import times in fresh interpreters."""
+    samples = {name: [] for name in MODULES}
+    for _ in range(args.imports):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT, *MODULES],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for name, seconds in json.loads(output).items():
+            samples[name].append(seconds)
+
+    for name, values in samples.items():
+        emit({"benchmark": "import", "module": name, "runs": args.imports, **summarize(values)}, stream)
+
+
+async def _async_disable_entities(hass, entries, keep: List[str]) -> int:
+    """Disable every entity of `entries` outside the `keep` platforms."""
+    registry = er.async_get(hass)
+    disabled = 0
+    for entry in entries:
+        for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+            if registry_entry.domain not in keep:
+                registry.async_update_entity(
+                    registry_entry.entity_id, disabled_by=er.RegistryEntryDisabler.USER
+                )
+                disabled += 1
+    return disabled
+
+
+async def bench_setup(args: argparse.Namespace, entries_count: int, stream: TextIO) -> None:
+    """Measure setup, then reloads with all and with most entities disabled."""
+    server = FakeMusicCastServer(cast_devices=args.cast_devices, latency=args.latency)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            start = time.perf_counter()
+            entries = await async_setup_entries(hass, server, entries_count)
+            setup_seconds = time.perf_counter() - start
+            await async_wait_for_first_refresh(hass, entries)
+
+            async def reload_all() -> float:
+                start = time.perf_counter()
+                await asyncio.gather(*(
+                    hass.config_entries.async_reload(entry.entry_id) for entry in entries
+                ))
+                await hass.async_block_till_done()
+                return time.perf_counter() - start
+
+            emit({
+                "benchmark": "setup",
+                "entries": entries_count,
+                "entities": len(hass.states.async_all()),
+                "platforms": len(get_coordinator(hass, entries[0]).platforms),
+                "setup_ms": round(setup_seconds * 1000, 3),
+            }, stream)
+
+            for disabled in (False, True):
+                if disabled:
+                    await _async_disable_entities(hass, entries, keep=[Platform.MEDIA_PLAYER])
+                samples = [await reload_all() for _ in range(args.reloads)]
+                emit({
+                    "benchmark": "reload",
+                    "entries": entries_count,
+                    "most_entities_disabled": disabled,
+                    "entities": len(hass.states.async_all()),
+                    "platforms": len(get_coordinator(hass, entries[0]).platforms),
+                    **summarize(samples),
+                }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    for entries_count in args.entries:
+        await bench_setup(args, entries_count, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 100])
+    parser.add_argument("--imports", type=int, default=5, help="Fresh interpreters to time imports in")
+    parser.add_argument("--reloads", type=int, default=3)
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    bench_import(args, args.output)
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
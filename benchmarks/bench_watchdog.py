@@ -0,0 +1,141 @@
+"""Time to recover stalled streams with the stream watchdog.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_watchdog --rounds 3 --stalled-starts 0 1 --output bench_output.txt
+
+Each round starts a stream on the fake server, then drops its audio server
+clients while it keeps reporting streaming. The watchdog has to detect the
+stall and restart the stream, `--stalled-starts` restarts staying stalled
+before one succeeds. Detection and recovery are timed from the stall, with
+polling and with long-poll. Each result is written as one JSON object per
+line.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict, TextIO
+
+from homeassistant.core import Event, callback
+
+from custom_components.music_cast.const import (
+    CONF_LONG_POLL,
+    CONF_SCAN_INTERVAL,
+    CONF_STREAM_WATCHDOG,
+    EVENT_STREAM_RECOVERED,
+    EVENT_STREAM_RECOVERY_FAILED,
+    EVENT_STREAM_STALLED,
+)
+
+from .fake_server import FakeMusicCastServer
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+
+async def bench_watchdog(
+    args: argparse.Namespace, long_poll: bool, stalled_starts: int, stream: TextIO
+) -> None:
+    """Measure detection and recovery time of stalled streams."""
+    server = FakeMusicCastServer(cast_devices=args.cast_devices, latency=args.latency)
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(
+                hass,
+                server,
+                1,
+                options={
+                    CONF_SCAN_INTERVAL: args.scan_interval,
+                    CONF_LONG_POLL: long_poll,
+                    CONF_STREAM_WATCHDOG: True,
+                },
+            )
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            # Time of each watchdog event in the round, by event type
+            fired: Dict[str, float] = {}
+            done = asyncio.Event()
+
+            @callback
+            def record_event(event: Event) -> None:
+                fired[event.event_type] = time.perf_counter()
+                if event.event_type != EVENT_STREAM_STALLED:
+                    done.set()
+
+            for event_type in (EVENT_STREAM_STALLED, EVENT_STREAM_RECOVERED, EVENT_STREAM_RECOVERY_FAILED):
+                hass.bus.async_listen(event_type, record_event)
+
+            detection_samples = []
+            recovery_samples = []
+            failed = 0
+            for _ in range(args.rounds):
+                server._set_streaming(True)
+                server.notify_status_changed()
+                await coordinator.async_refresh()
+                fired.clear()
+                done.clear()
+
+                server.stall_stream(stalled_starts)
+                start = time.perf_counter()
+                try:
+                    await asyncio.wait_for(done.wait(), args.timeout)
+                except asyncio.TimeoutError:
+                    failed += 1
+                    continue
+
+                if EVENT_STREAM_STALLED in fired:
+                    detection_samples.append(fired[EVENT_STREAM_STALLED] - start)
+                if EVENT_STREAM_RECOVERED in fired:
+                    recovery_samples.append(fired[EVENT_STREAM_RECOVERED] - start)
+                else:
+                    failed += 1
+
+            stats = coordinator.stats
+            emit({
+                "benchmark": "watchdog",
+                "long_poll": long_poll,
+                "scan_interval": args.scan_interval,
+                "stalled_starts": stalled_starts,
+                "rounds": args.rounds,
+                "failed_rounds": failed,
+                "recovery_attempts": stats.stream_recovery_attempts,
+                "detection": summarize(detection_samples),
+                "recovery": summarize(recovery_samples),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    for stalled_starts in args.stalled_starts:
+        for long_poll in (False, True):
+            await bench_watchdog(args, long_poll, stalled_starts, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--stalled-starts", type=int, nargs="+", default=[0, 1])
+    parser.add_argument("--scan-interval", type=float, default=30.0, help="Seconds between regular refreshes")
+    parser.add_argument("--cast-devices", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for each recovery")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""Compare bytes on the wire and decode time of the response formats.
+
+Run from the repository root (install msgpack to include binary formats):
+
+    python -m benchmarks.bench_wire_formats --cast-devices 10 200 1000 --output bench_output.txt
+
+Every refresh fetches status and both inventories. Each result is written
+as one JSON object per line.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import TextIO
+
+from .fake_server import FakeMusicCastServer, msgpack
+from .harness import (
+    async_benchmark_hass,
+    async_setup_entries,
+    async_wait_for_first_refresh,
+    emit,
+    get_coordinator,
+    summarize,
+)
+
+
+async def bench_format(
+    args: argparse.Namespace, cast_devices: int, compression: bool, binary: bool, stream: TextIO
+) -> None:
+    """Measure full refreshes with the server offering the given formats."""
+    server = FakeMusicCastServer(
+        audio_devices=args.audio_devices,
+        cast_devices=cast_devices,
+        latency=args.latency,
+        compression=compression,
+        binary=binary,
+    )
+    await server.start()
+    try:
+        async with async_benchmark_hass() as hass:
+            (entry,) = await async_setup_entries(hass, server, 1)
+            await async_wait_for_first_refresh(hass, [entry])
+            coordinator = get_coordinator(hass, entry)
+
+            server.reset_counters()
+            coordinator.stats.formats.clear()
+            samples = []
+            for _ in range(args.refreshes):
+                coordinator._inventory_stale = True
+                start = time.perf_counter()
+                await coordinator.async_refresh()
+                samples.append(time.perf_counter() - start)
+
+            emit({
+                "benchmark": "wire_formats",
+                "compression": compression,
+                "binary": binary,
+                "cast_devices": cast_devices,
+                "latency_ms": args.latency * 1000,
+                "refreshes": args.refreshes,
+                "bytes_per_refresh": server.bytes_sent / args.refreshes,
+                "formats": {
+                    name: totals.as_dict() for name, totals in coordinator.stats.formats.items()
+                },
+                **summarize(samples),
+            }, stream)
+    finally:
+        await server.stop()
+
+
+async def async_main(args: argparse.Namespace, stream: TextIO) -> None:
+    """Run the selected benchmarks."""
+    for cast_devices in args.cast_devices:
+        for binary in (False, True) if msgpack is not None else (False,):
+            for compression in (False, True):
+                await bench_format(args, cast_devices, compression, binary, stream)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cast-devices", type=int, nargs="+", default=[10, 200, 1000])
+    parser.add_argument("--refreshes", type=int, default=20)
+    parser.add_argument("--audio-devices", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--output", type=argparse.FileType("a"), default=sys.stdout)
+    args = parser.parse_args()
+
+    asyncio.run(async_main(args, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""In-process fake of the MusicCast server API.
+
+The fake keeps just enough state for the integration to behave as it does
+against a real server, and adds knobs for latency, jitter, failures and
+inventory sizes.
+"""
+
+import asyncio
+import gzip
+import json
+import random
+import socket
+import zlib
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from .payloads import make_audio_devices, make_cast_devices, make_status
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Smaller bodies are not worth compressing
+COMPRESSION_MIN_SIZE = 256
+
+
+class FakeMusicCastServer:
+    """Fake MusicCast server running on an aiohttp web application."""
+
+    def __init__(
+        self,
+        *,
+        audio_devices: int = 2,
+        cast_devices: int = 5,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        discovery_delay: float = 0.0,
+        batch: bool = True,
+        long_poll: bool = True,
+        long_poll_hold: float = 25.0,
+        compression: bool = False,
+        binary: bool = False,
+        noise_level: Optional[float] = None,
+        signal_level: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the fake server."""
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.discovery_delay = discovery_delay
+        self.batch = batch
+        self.long_poll = long_poll
+        self.long_poll_hold = long_poll_hold
+        self.compression = compression
+        self.binary = binary and msgpack is not None
+        self.noise_level = noise_level
+        self.signal_level = signal_level
+        self.random = random.Random(seed)
+
+        self.status: Dict[str, Any] = make_status()
+        self.audio_devices: Dict[str, Any] = make_audio_devices(audio_devices)
+        self.cast_devices: Dict[str, Any] = make_cast_devices(cast_devices)
+        # Bumped on every change of the status, for long-poll requests
+        self.status_version = 0
+        self._status_changed: Optional[asyncio.Event] = None
+        # Stream starts that still leave the audio server without clients
+        self.stalled_starts = 0
+
+        # Requests served, keyed by "METHOD route"
+        self.requests: Counter = Counter()
+        # Commands applied through /batch, keyed by route
+        self.batched_commands: Counter = Counter()
+        self.bytes_sent = 0
+
+        self.port: Optional[int] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server."""
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests served since the last reset."""
+        return sum(self.requests.values())
+
+    def reset_counters(self) -> None:
+        """Reset request and byte counters."""
+        self.requests.clear()
+        self.batched_commands.clear()
+        self.bytes_sent = 0
+
+    def notify_status_changed(self) -> None:
+        """Bump the status version and answer pending long-poll requests.
+
+        POST commands call this automatically, tests that change `status`
+        directly call it themselves.
+        """
+        self.status_version += 1
+        if self._status_changed is not None:
+            self._status_changed.set()
+            self._status_changed = None
+
+    def stall_stream(self, stalled_starts: int = 0) -> None:
+        """Drop the audio server clients while still reporting streaming.
+
+        The next `stalled_starts` stream starts stay stalled, later ones
+        reconnect the clients.
+        """
+        self.status["audio_server"]["clients_connected"] = 0
+        self.stalled_starts = stalled_starts
+        self.notify_status_changed()
+
+    def set_cast_device_count(self, count: int) -> None:
+        """Replace the cast device inventory."""
+        self.cast_devices = make_cast_devices(count)
+
+    def build_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/", self._handle_root)
+        app.router.add_get("/status", self._handle_status)
+        app.router.add_get("/audio-devices", self._handle_audio_devices)
+        app.router.add_get("/cast-devices", self._handle_cast_devices)
+        app.router.add_post("/auto-detection/{action:start|stop|enable|disable}", self._handle_auto_detection)
+        app.router.add_post("/auto-detection/threshold/{value}", self._handle_threshold)
+        app.router.add_post("/auto-detection/silence-timeout/{value}", self._handle_silence_timeout)
+        app.router.add_post("/stream/{action:start|stop}", self._handle_stream)
+        app.router.add_post("/volume/{value}", self._handle_volume)
+        app.router.add_post("/{action:mute|unmute}", self._handle_mute)
+        app.router.add_post("/audio-devices/{index}", self._handle_set_audio_device)
+        app.router.add_post("/cast-devices/{uuid}/connect", self._handle_connect)
+        if self.batch:
+            app.router.add_post("/batch", self._handle_batch)
+        return app
+
+    async def start(self, port: int = 0) -> None:
+        """Start serving on localhost."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+        self.port = sock.getsockname()[1]
+
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Count requests and inject latency and failures."""
+        route = request.match_info.route.resource
+        self.requests[f"{request.method} {route.canonical if route else request.path}"] += 1
+
+        delay = self.latency
+        if self.jitter:
+            delay += self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            return web.json_response({"detail": "Injected failure"}, status=500)
+
+        response = await handler(request)
+        if request.method == "POST":
+            self.notify_status_changed()
+        if isinstance(response, web.Response) and response.body is not None:
+            self._encode(request, response)
+            self.bytes_sent += len(response.body)
+        return response
+
+    def _encode(self, request: web.Request, response: web.Response) -> None:
+        """Re-encode a JSON response in the best format the client accepts."""
+        body = response.body
+        if (
+            self.binary
+            and response.content_type == "application/json"
+            and "application/msgpack" in request.headers.get("Accept", "")
+        ):
+            body = msgpack.packb(json.loads(body))
+            response.content_type = "application/msgpack"
+
+        accept_encoding = request.headers.get("Accept-Encoding", "")
+        if self.compression and len(body) >= COMPRESSION_MIN_SIZE:
+            if "gzip" in accept_encoding:
+                body = gzip.compress(body, compresslevel=6)
+                response.headers["Content-Encoding"] = "gzip"
+            elif "deflate" in accept_encoding:
+                body = zlib.compress(body, 6)
+                response.headers["Content-Encoding"] = "deflate"
+
+        response.body = body
+
+    async def _handle_root(self, request: web.Request) -> web.Response:
+        return web.json_response({"message": "MusicCast Audio Server"})
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        if not self.long_poll:
+            return web.json_response(self._project_status(request))
+
+        if request.query.get("wait") == str(self.status_version):
+            if self._status_changed is None:
+                self._status_changed = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._status_changed.wait(), self.long_poll_hold)
+            except asyncio.TimeoutError:
+                pass
+        return web.json_response({**self._project_status(request), "version": self.status_version})
+
+    def _project_status(self, request: web.Request) -> Dict[str, Any]:
+        # The input level varies by +/- 50% around the noise or, while
+        # streaming, the signal level. It stays 0 unless they are set, so
+        # other benchmarks see an unchanged status.
+        level = self.signal_level if self.status["streaming"] else self.noise_level
+        if level is not None:
+            self.status["auto_detection"]["level"] = round(level * self.random.uniform(0.5, 1.5), 6)
+
+        status = self.status
+        if (fields := request.query.get("fields")) is not None:
+            # An empty list selects no fields
+            wanted = set(fields.split(",")) if fields else set()
+            status = {key: value for key, value in status.items() if key in wanted}
+        return status
+
+    async def _handle_audio_devices(self, request: web.Request) -> web.Response:
+        return web.json_response(self.audio_devices)
+
+    async def _handle_cast_devices(self, request: web.Request) -> web.Response:
+        if request.query.get("refresh") == "true" and self.discovery_delay:
+            await asyncio.sleep(self.discovery_delay)
+        return web.json_response(self.cast_devices)
+
+    async def _handle_auto_detection(self, request: web.Request) -> web.Response:
+        auto_detection = self.status["auto_detection"]
+        action = request.match_info["action"]
+        if action in ("enable", "disable"):
+            auto_detection["enabled"] = action == "enable"
+        else:
+            auto_detection["running"] = action == "start"
+            if action == "stop":
+                self._set_streaming(False)
+        return _ok()
+
+    async def _handle_threshold(self, request: web.Request) -> web.Response:
+        self.status["auto_detection"]["threshold"] = float(request.match_info["value"])
+        return _ok()
+
+    async def _handle_silence_timeout(self, request: web.Request) -> web.Response:
+        self.status["auto_detection"]["silence_timeout"] = float(request.match_info["value"])
+        return _ok()
+
+    async def _handle_stream(self, request: web.Request) -> web.Response:
+        self._set_streaming(request.match_info["action"] == "start")
+        return _ok()
+
+    async def _handle_volume(self, request: web.Request) -> web.Response:
+        self.status["cast_device"]["volume_level"] = float(request.match_info["value"])
+        return _ok()
+
+    async def _handle_mute(self, request: web.Request) -> web.Response:
+        self.status["cast_device"]["is_muted"] = request.match_info["action"] == "mute"
+        return _ok()
+
+    async def _handle_set_audio_device(self, request: web.Request) -> web.Response:
+        index = int(request.match_info["index"])
+        if not any(device["index"] == index for device in self.audio_devices["devices"]):
+            return web.json_response({"detail": "Unknown device"}, status=404)
+        self.audio_devices["current_device"] = index
+        return _ok()
+
+    async def _handle_connect(self, request: web.Request) -> web.Response:
+        uuid = request.match_info["uuid"]
+        for device in self.cast_devices["devices"]:
+            if device["uuid"] == uuid:
+                self.status["cast_device"].update({
+                    "connected": True,
+                    "uuid": uuid,
+                    "device_name": device["name"],
+                    "device_model": device["model_name"],
+                    "display_name": "Default Media Receiver",
+                    "volume_level": self.status["cast_device"].get("volume_level") or 0.5,
+                    "is_muted": False,
+                })
+                return _ok()
+        return web.json_response({"detail": "Unknown device"}, status=404)
+
+    async def _handle_batch(self, request: web.Request) -> web.Response:
+        """Apply POST commands in order through their regular handlers."""
+        payload = await request.json()
+        results = []
+        for command in payload.get("commands", []):
+            probe = make_mocked_request(command.get("method", "POST"), command["path"], app=request.app)
+            match_info = await request.app.router.resolve(probe)
+            if match_info.http_exception is not None:
+                results.append({"status": match_info.http_exception.status})
+                continue
+
+            self.batched_commands[match_info.route.resource.canonical] += 1
+            command_request = make_mocked_request(
+                probe.method, probe.path, match_info=dict(match_info), app=request.app
+            )
+            response = await match_info.handler(command_request)
+            results.append({"status": response.status})
+        return web.json_response({"results": results})
+
+    def _set_streaming(self, streaming: bool) -> None:
+        self.status["streaming"] = streaming
+        stalled = streaming and self.stalled_starts > 0
+        if stalled:
+            self.stalled_starts -= 1
+        self.status["audio_server"]["clients_connected"] = 1 if streaming and not stalled else 0
+        self.status["audio_server"]["recording"] = streaming
+
+
+def _ok() -> web.Response:
+    return web.json_response({"success": True})
@@ -0,0 +1,126 @@
+"""Helpers to run the integration inside an in-process Home Assistant."""
+
+import asyncio
+import json
+import statistics
+import sys
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Dict, Generator, Iterable, List, Optional, TextIO
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.music_cast.const import (
+    CONF_HOST,
+    CONF_PORT,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.music_cast.coordinator import MusicCastCoordinator
+
+from .fake_server import FakeMusicCastServer
+
+
+@asynccontextmanager
+async def async_benchmark_hass() -> AsyncGenerator[HomeAssistant, None]:
+    """Yield a running Home Assistant instance with custom integrations enabled."""
+    # Imported here, importing the loader before homeassistant.core is circular
+    from homeassistant import loader
+
+    async with async_test_home_assistant() as hass:
+        # Let the loader pick up custom_components/ from the repository root
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+async def async_setup_entries(
+    hass: HomeAssistant,
+    server: FakeMusicCastServer,
+    count: int,
+    options: Optional[Dict[str, Any]] = None,
+) -> List[MockConfigEntry]:
+    """Add `count` config entries pointing at `server` and set them up."""
+    entries = []
+    for index in range(count):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"MusicCast bench {index}",
+            unique_id=f"bench-{index}",
+            data={
+                CONF_HOST: "127.0.0.1",
+                CONF_PORT: server.port,
+                CONF_SCAN_INTERVAL: 30,
+            },
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+    return entries
+
+
+async def async_wait_for_first_refresh(
+    hass: HomeAssistant, entries: Iterable[MockConfigEntry], timeout: float = 60
+) -> bool:
+    """Wait until every entry's coordinator has data from the server.
+
+    Setup does not wait for the first refresh, which runs in the background.
+    """
+    results = await asyncio.gather(*(
+        get_coordinator(hass, entry).async_wait_for_state(lambda data: True, timeout)
+        for entry in entries
+    ))
+    return all(results)
+
+
+def get_coordinator(hass: HomeAssistant, entry: MockConfigEntry) -> MusicCastCoordinator:
+    """Return the coordinator of a loaded config entry."""
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+@contextmanager
+def count_state_writes() -> Generator[Dict[str, int], None, None]:
+    """Count calls to Entity.async_write_ha_state while active."""
+    counter = {"writes": 0}
+    original = Entity.async_write_ha_state
+
+    @callback
+    def async_write_ha_state(self: Entity) -> None:
+        counter["writes"] += 1
+        original(self)
+
+    Entity.async_write_ha_state = async_write_ha_state
+    try:
+        yield counter
+    finally:
+        Entity.async_write_ha_state = original
+
+
+def summarize(samples: Iterable[float]) -> Dict[str, float]:
+    """Return mean, p50, p95 and max of timing samples in milliseconds."""
+    values = sorted(samples)
+    if not values:
+        return {}
+    p95_index = min(len(values) - 1, round(0.95 * (len(values) - 1)))
+    return {
+        "mean_ms": round(statistics.fmean(values) * 1000, 3),
+        "p50_ms": round(statistics.median(values) * 1000, 3),
+        "p95_ms": round(values[p95_index] * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+def emit(result: Dict[str, Any], stream: TextIO = sys.stdout) -> None:
+    """Write one benchmark result as a JSON line."""
+    stream.write(json.dumps(result, sort_keys=True) + "\n")
+    stream.flush()
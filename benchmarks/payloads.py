@@ -0,0 +1,65 @@
+"""Synthetic MusicCast API payloads used by the benchmarks."""
+
+from typing import Any, Dict
+
+
+def make_status(streaming: bool = False, connected: bool = True) -> Dict[str, Any]:
+    """Return a /status document."""
+    return {
+        "streaming": streaming,
+        "auto_detection": {
+            "enabled": True,
+            "running": False,
+            "threshold": 0.01,
+            "silence_timeout": 5.0,
+            "level": 0.0,
+        },
+        "cast_device": {
+            "connected": connected,
+            "uuid": "00000000-0000-0000-0000-000000000000" if connected else None,
+            "device_name": "Cast Device 0" if connected else None,
+            "device_model": "Google Nest Mini" if connected else None,
+            "display_name": "Default Media Receiver" if connected else None,
+            "volume_level": 0.5 if connected else None,
+            "is_muted": False if connected else None,
+        },
+        "audio_server": {
+            "clients_connected": 1 if streaming else 0,
+            "recording": streaming,
+            "port": 8001,
+        },
+    }
+
+
+def make_audio_devices(count: int, current_device: int = 0) -> Dict[str, Any]:
+    """Return an /audio-devices document with `count` inputs."""
+    return {
+        "current_device": current_device if count else None,
+        "devices": [
+            {
+                "index": index,
+                "name": f"Audio Input {index}",
+                "channels": 2,
+                "sample_rate": 48000,
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def make_cast_devices(count: int) -> Dict[str, Any]:
+    """Return a /cast-devices document with `count` speakers."""
+    return {
+        "devices": [
+            {
+                "uuid": f"{index:08d}-0000-0000-0000-000000000000",
+                "name": f"Cast Device {index}",
+                "model_name": "Google Nest Mini",
+                "manufacturer": "Google Inc.",
+                "cast_type": "audio",
+                "host": f"192.168.{index // 250}.{index % 250 + 2}",
+                "port": 8009,
+            }
+            for index in range(count)
+        ],
+    }
@@ -0,0 +1,206 @@
+"""Replay server feeding recorded MusicCast traffic back to the integration.
+
+Serve a recording made with the Record Server Traffic option, ten times
+faster than it was recorded:
+
+    python -m benchmarks.replay_server traffic_<entry id>.jsonl.1 traffic_<entry id>.jsonl --speed 10 --port 8000
+
+Rotated files can be passed together, in any order. The replay clock
+starts with the first request. Each request is answered with the latest
+recorded response to the same request at that point of the recording,
+after the recorded response time. Requests with different query
+parameters, such as long-poll versions, fall back to the latest response
+for the same method and path. Recorded connection errors and timeouts
+close the connection.
+"""
+
+import argparse
+import asyncio
+import base64
+import bisect
+import json
+import socket
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from aiohttp import web
+
+
+def load_recording(paths: Iterable[str], server: Optional[int] = 0) -> List[Dict[str, Any]]:
+    """Read the exchanges with one server from recording files.
+
+    With `server` None, exchanges with every server are kept.
+    """
+    exchanges = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                exchange = json.loads(line)
+                if server is None or exchange.get("server", 0) == server:
+                    exchanges.append(exchange)
+    exchanges.sort(key=lambda exchange: exchange["time"])
+    return exchanges
+
+
+def _exact_key(method: str, path: str, query: Iterable[Tuple[str, str]]) -> Tuple[Any, ...]:
+    return (method, path, tuple(sorted(query)))
+
+
+class ReplayServer:
+    """Serve recorded responses on an aiohttp web application."""
+
+    def __init__(self, exchanges: List[Dict[str, Any]], *, speed: float = 1.0) -> None:
+        """Index the exchanges by request."""
+        if not exchanges:
+            raise ValueError("The recording has no exchanges")
+        self.speed = speed
+        self.start_time = exchanges[0]["time"]
+        self.end_time = exchanges[-1]["time"]
+
+        # Offsets into the recording and exchanges, by exact and by loose key
+        self._timelines: Dict[Tuple[Any, ...], Tuple[List[float], List[Dict[str, Any]]]] = {}
+        for exchange in exchanges:
+            split = urlsplit(exchange["path"])
+            query = parse_qsl(split.query) + list(exchange.get("params", {}).items())
+            offset = exchange["time"] - self.start_time
+            for key in (
+                _exact_key(exchange["method"], split.path, query),
+                (exchange["method"], split.path),
+            ):
+                offsets, entries = self._timelines.setdefault(key, ([], []))
+                offsets.append(offset)
+                entries.append(exchange)
+
+        # Requests served, keyed by "METHOD path"
+        self.requests: Counter = Counter()
+        self.unmatched = 0
+        self.bytes_sent = 0
+        self._clock_start: Optional[float] = None
+
+        self.port: Optional[int] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server."""
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def duration(self) -> float:
+        """Return the seconds the recording takes to replay."""
+        return (self.end_time - self.start_time) / self.speed
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests served since the last reset."""
+        return sum(self.requests.values())
+
+    def reset_counters(self) -> None:
+        """Reset request and byte counters."""
+        self.requests.clear()
+        self.unmatched = 0
+        self.bytes_sent = 0
+
+    def lookup(
+        self, method: str, path: str, query: Iterable[Tuple[str, str]], offset: float
+    ) -> Optional[Dict[str, Any]]:
+        """Return the latest exchange matching a request `offset` seconds into the recording."""
+        timeline = (
+            self._timelines.get(_exact_key(method, path, query))
+            or self._timelines.get((method, path))
+        )
+        if timeline is None:
+            return None
+        offsets, entries = timeline
+        return entries[max(0, bisect.bisect_right(offsets, offset) - 1)]
+
+    def build_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        return app
+
+    async def start(self, port: int = 0) -> None:
+        """Start serving on localhost."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+        self.port = sock.getsockname()[1]
+
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a request with its recorded response."""
+        now = asyncio.get_running_loop().time()
+        if self._clock_start is None:
+            self._clock_start = now
+        offset = (now - self._clock_start) * self.speed
+
+        self.requests[f"{request.method} {request.path}"] += 1
+        exchange = self.lookup(request.method, request.path, request.query.items(), offset)
+        if exchange is None:
+            self.unmatched += 1
+            return web.json_response({"detail": "Not in recording"}, status=404)
+
+        await asyncio.sleep(exchange["elapsed"] / self.speed)
+        if "status" not in exchange:
+            # Recorded as a connection error or timeout
+            if request.transport is not None:
+                request.transport.close()
+            return web.Response(status=503)
+
+        if "body" in exchange:
+            body = exchange["body"].encode()
+        elif "body_base64" in exchange:
+            body = base64.b64decode(exchange["body_base64"])
+        else:
+            return web.Response(status=exchange["status"])
+
+        response = web.Response(
+            status=exchange["status"], body=body, content_type=exchange.get("content_type")
+        )
+        if exchange.get("encoding"):
+            response.headers["Content-Encoding"] = exchange["encoding"]
+        self.bytes_sent += len(body)
+        return response
+
+
+async def async_serve(args: argparse.Namespace) -> None:
+    """Serve a recording until interrupted."""
+    server = ReplayServer(load_recording(args.recording, args.server), speed=args.speed)
+    await server.start(args.port)
+    print(f"Replaying {server.duration:.0f}s of traffic on {server.url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Parse arguments and serve the recording."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="+", help="Recording files")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed, 1 being as recorded")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--server", type=int, default=0, help="Position of the recorded server, 0 being the primary")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(async_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,96 @@
 """MusicCast integration for Home Assistant."""
 
 import logging
+from typing import Dict, List
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 from .coordinator import MusicCastCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SWITCH, Platform.SENSOR, Platform.NUMBER, Platform.SELECT, Platform.BUTTON]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MusicCast integration."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up MusicCast from a config entry."""
+    """Set up MusicCast from a config entry.
+
+    Setup does not wait for the server: entities restore their last state
+    and the first refresh runs in the background, so an unreachable server
+    is retried by the coordinator's polling instead of a setup retry loop.
+    """
     coordinator = MusicCastCoordinator(hass, entry)
 
-    if not await coordinator.async_setup():
-        raise ConfigEntryNotReady("Failed to connect to MusicCast server")
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    coordinator.platforms = _async_enabled_platforms(hass, entry)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+    )
+    coordinator.async_update_long_poll()
+    coordinator.async_update_traffic_recorder()
+    coordinator.async_update_watchdog()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async def async_shutdown_on_stop(_event: Event) -> None:
+        """Stop refreshes, long-poll and the watchdog before the shared session closes.
+
+        Config entries are not unloaded when Home Assistant stops.
+        """
+        await coordinator.async_shutdown()
+
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, async_shutdown_on_stop)
+    )
 
     return True
 
 
+@callback
+def _async_enabled_platforms(hass: HomeAssistant, entry: ConfigEntry) -> List[Platform]:
+    """Return the platforms to load for a config entry.
+
+    A platform is skipped, and its module never imported, when all of its
+    registered entities are disabled. Enabling one of them reloads the
+    entry, which loads the platform again. New entries load every platform.
+    """
+    all_disabled: Dict[str, bool] = {}
+    for registry_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        all_disabled[registry_entry.domain] = (
+            all_disabled.get(registry_entry.domain, True) and registry_entry.disabled
+        )
+
+    return [platform for platform in PLATFORMS if not all_disabled.get(platform, False)]
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options without reloading the config entry."""
+    coordinator: MusicCastCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_options(entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator: MusicCastCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
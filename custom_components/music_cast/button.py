@@ -5,12 +5,12 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ async def async_setup_entry(
     ])
 
 
-class MusicCastButtonBase(CoordinatorEntity, ButtonEntity):
+class MusicCastButtonBase(MusicCastEntity, ButtonEntity):
     """Base class for MusicCast button entities."""
 
     _attr_has_entity_name = True
@@ -38,19 +38,7 @@ class MusicCastButtonBase(CoordinatorEntity, ButtonEntity):
         """Initialize the button entity."""
         super().__init__(coordinator)
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        self._attr_device_info = coordinator.device_info
 
 
 class MusicCastRefreshCastDevicesButton(MusicCastButtonBase):
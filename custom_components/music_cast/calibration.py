@@ -0,0 +1,104 @@
+"""Audio threshold calibration for MusicCast integration."""
+
+import math
+import statistics
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from .const import (
+    AUDIO_THRESHOLD_MAX,
+    AUDIO_THRESHOLD_MIN,
+    CALIBRATION_NOISE_MARGIN,
+    CALIBRATION_SIGNAL_GAP,
+    CALIBRATION_TIMEOUT_MARGIN,
+    SILENCE_TIMEOUT_MAX,
+    SILENCE_TIMEOUT_MIN,
+)
+
+# Levels are floored at this value when comparing ratios, silence reads 0
+_LEVEL_FLOOR = AUDIO_THRESHOLD_MIN / 10
+
+
+@dataclass(frozen=True, slots=True)
+class Calibration:
+    """Threshold and silence timeout computed from sampled input levels.
+
+    `silence_timeout` is None when the window held no quiet gap within
+    signal to measure, and the current timeout is then kept.
+    """
+
+    samples: int
+    noise_floor: float
+    signal_level: Optional[float]
+    threshold: float
+    silence_timeout: Optional[float]
+
+    @classmethod
+    def from_levels(cls, levels: Sequence[float], interval: float) -> "Calibration":
+        """Calibrate from levels sampled every `interval` seconds, in order."""
+        ordered = sorted(levels)
+        split = _signal_split(ordered)
+        # Upper edge of the noise and lower edge of the signal
+        noise_floor = _percentiles(ordered[:split])[94]
+        signal_level = _percentiles(ordered[split:])[4] if split < len(ordered) else None
+
+        if signal_level is not None:
+            # Geometric midpoint, the same ratio away from noise and signal
+            threshold = math.sqrt(max(noise_floor, _LEVEL_FLOOR) * signal_level)
+        else:
+            threshold = noise_floor * CALIBRATION_NOISE_MARGIN
+        # Rounded to the step of the threshold number entity
+        threshold = round(min(max(threshold, AUDIO_THRESHOLD_MIN), AUDIO_THRESHOLD_MAX), 3)
+
+        silence_timeout = None
+        if (gap := _longest_quiet_gap(levels, threshold)) is not None:
+            timeout = (gap + 1) * interval * CALIBRATION_TIMEOUT_MARGIN
+            # Rounded up to the step of the silence timeout number entity
+            silence_timeout = min(max(math.ceil(timeout * 2) / 2, SILENCE_TIMEOUT_MIN), SILENCE_TIMEOUT_MAX)
+
+        return cls(
+            samples=len(levels),
+            noise_floor=round(noise_floor, 6),
+            signal_level=round(signal_level, 6) if signal_level is not None else None,
+            threshold=threshold,
+            silence_timeout=silence_timeout,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the calibration as a service response."""
+        return asdict(self)
+
+
+def _percentiles(values: Sequence[float]) -> List[float]:
+    """Return the 1st to 99th percentiles of sorted values in one pass."""
+    if len(values) < 2:
+        return [values[0]] * 99
+    return statistics.quantiles(values, n=100, method="inclusive")
+
+
+def _signal_split(ordered: Sequence[float]) -> int:
+    """Return the index of the first signal level in sorted levels.
+
+    Signal starts after the largest jump between consecutive levels, if it
+    is at least CALIBRATION_SIGNAL_GAP. Otherwise every level is noise.
+    """
+    split, largest = len(ordered), CALIBRATION_SIGNAL_GAP
+    for index in range(1, len(ordered)):
+        ratio = max(ordered[index], _LEVEL_FLOOR) / max(ordered[index - 1], _LEVEL_FLOOR)
+        if ratio >= largest:
+            split, largest = index, ratio
+    return split
+
+
+def _longest_quiet_gap(levels: Sequence[float], threshold: float) -> Optional[int]:
+    """Return the most consecutive levels below the threshold between levels above it."""
+    longest: Optional[int] = None
+    run: Optional[int] = None  # None until the first level above the threshold
+    for level in levels:
+        if level >= threshold:
+            if run:
+                longest = max(longest or 0, run)
+            run = 0
+        elif run is not None:
+            run += 1
+    return longest
\ No newline at end of file
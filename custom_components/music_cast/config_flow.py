@@ -9,6 +9,7 @@ import async_timeout
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -17,18 +18,58 @@ from .const import (
     DEFAULT_HOST,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_MAX_PAYLOAD_SIZE,
+    DEFAULT_INVENTORY_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_DISCOVERY_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_RATE_LIMIT_STREAMING,
+    DEFAULT_RATE_LIMIT_VOLUME,
+    DEFAULT_RATE_LIMIT_SETTINGS,
+    DEFAULT_RATE_LIMIT_DEVICE,
     CONF_SCAN_INTERVAL,
+    CONF_MAX_PAYLOAD_SIZE,
+    CONF_INVENTORY_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_DISCOVERY_TIMEOUT,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_RATE_LIMIT_STREAMING,
+    CONF_RATE_LIMIT_VOLUME,
+    CONF_RATE_LIMIT_SETTINGS,
+    CONF_RATE_LIMIT_DEVICE,
+    CONF_STANDBY_SERVERS,
+    CONF_LONG_POLL,
+    CONF_RECORD_TRAFFIC,
+    CONF_STREAM_WATCHDOG,
+    SCAN_INTERVAL_MIN,
+    SCAN_INTERVAL_MAX,
+    INVENTORY_INTERVAL_MAX,
+    REQUEST_TIMEOUT_MIN,
+    REQUEST_TIMEOUT_MAX,
+    DISCOVERY_TIMEOUT_MAX,
+    MAX_CONCURRENT_REQUESTS_MAX,
+    MAX_PAYLOAD_SIZE_MIN,
+    MAX_PAYLOAD_SIZE_MAX,
+    RATE_LIMIT_MIN,
+    RATE_LIMIT_MAX,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_HOST,
     ERROR_TIMEOUT,
+    ERROR_INVALID_STANDBY_SERVERS,
 )
+from .coordinator import parse_standby_servers
 
 _LOGGER = logging.getLogger(__name__)
 
 DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_HOST, default=DEFAULT_HOST): str,
     vol.Required(CONF_PORT, default=DEFAULT_PORT): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+    vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=SCAN_INTERVAL_MIN, max=SCAN_INTERVAL_MAX)
+    ),
+    vol.Optional(CONF_MAX_PAYLOAD_SIZE, default=DEFAULT_MAX_PAYLOAD_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=MAX_PAYLOAD_SIZE_MIN, max=MAX_PAYLOAD_SIZE_MAX)
+    ),
 })
 
 
@@ -37,6 +78,14 @@ class MusicCastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow handler."""
+        return MusicCastOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle the initial step."""
         errors: Dict[str, str] = {}
@@ -69,7 +118,7 @@ class MusicCastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         url = f"http://{host}:{port}/"
         
         try:
-            with async_timeout.timeout(10):
+            async with async_timeout.timeout(10):
                 async with session.get(url) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -85,4 +134,93 @@ class MusicCastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return ERROR_CANNOT_CONNECT
         except Exception as ex:
             _LOGGER.exception("Unexpected error connecting to MusicCast: %s", ex)
-            return ERROR_CANNOT_CONNECT
\ No newline at end of file
+            return ERROR_CANNOT_CONNECT
+
+
+class MusicCastOptionsFlow(config_entries.OptionsFlow):
+    """Handle MusicCast options.
+
+    Options are applied to the running coordinator without reloading the
+    config entry.
+    """
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
+        """Manage the options."""
+        errors: Dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                parse_standby_servers(user_input.get(CONF_STANDBY_SERVERS, ""))
+            except ValueError:
+                errors[CONF_STANDBY_SERVERS] = ERROR_INVALID_STANDBY_SERVERS
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        config = {**self._entry.data, **self._entry.options, **(user_input or {})}
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_SCAN_INTERVAL,
+                    default=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=SCAN_INTERVAL_MIN, max=SCAN_INTERVAL_MAX)),
+                vol.Required(
+                    CONF_INVENTORY_INTERVAL,
+                    default=config.get(CONF_INVENTORY_INTERVAL, DEFAULT_INVENTORY_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=SCAN_INTERVAL_MIN, max=INVENTORY_INTERVAL_MAX)),
+                vol.Required(
+                    CONF_REQUEST_TIMEOUT,
+                    default=config.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=REQUEST_TIMEOUT_MIN, max=REQUEST_TIMEOUT_MAX)),
+                vol.Required(
+                    CONF_DISCOVERY_TIMEOUT,
+                    default=config.get(CONF_DISCOVERY_TIMEOUT, DEFAULT_DISCOVERY_TIMEOUT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=REQUEST_TIMEOUT_MIN, max=DISCOVERY_TIMEOUT_MAX)),
+                vol.Required(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=config.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENT_REQUESTS_MAX)),
+                vol.Required(
+                    CONF_MAX_PAYLOAD_SIZE,
+                    default=config.get(CONF_MAX_PAYLOAD_SIZE, DEFAULT_MAX_PAYLOAD_SIZE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=MAX_PAYLOAD_SIZE_MIN, max=MAX_PAYLOAD_SIZE_MAX)),
+                vol.Required(
+                    CONF_RATE_LIMIT_STREAMING,
+                    default=config.get(CONF_RATE_LIMIT_STREAMING, DEFAULT_RATE_LIMIT_STREAMING),
+                ): vol.All(vol.Coerce(int), vol.Range(min=RATE_LIMIT_MIN, max=RATE_LIMIT_MAX)),
+                vol.Required(
+                    CONF_RATE_LIMIT_VOLUME,
+                    default=config.get(CONF_RATE_LIMIT_VOLUME, DEFAULT_RATE_LIMIT_VOLUME),
+                ): vol.All(vol.Coerce(int), vol.Range(min=RATE_LIMIT_MIN, max=RATE_LIMIT_MAX)),
+                vol.Required(
+                    CONF_RATE_LIMIT_SETTINGS,
+                    default=config.get(CONF_RATE_LIMIT_SETTINGS, DEFAULT_RATE_LIMIT_SETTINGS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=RATE_LIMIT_MIN, max=RATE_LIMIT_MAX)),
+                vol.Required(
+                    CONF_RATE_LIMIT_DEVICE,
+                    default=config.get(CONF_RATE_LIMIT_DEVICE, DEFAULT_RATE_LIMIT_DEVICE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=RATE_LIMIT_MIN, max=RATE_LIMIT_MAX)),
+                vol.Optional(
+                    CONF_STANDBY_SERVERS,
+                    default=config.get(CONF_STANDBY_SERVERS, ""),
+                ): str,
+                vol.Required(
+                    CONF_LONG_POLL,
+                    default=config.get(CONF_LONG_POLL, False),
+                ): bool,
+                vol.Required(
+                    CONF_RECORD_TRAFFIC,
+                    default=config.get(CONF_RECORD_TRAFFIC, False),
+                ): bool,
+                vol.Optional(
+                    CONF_STREAM_WATCHDOG,
+                    default=config.get(CONF_STREAM_WATCHDOG, False),
+                ): bool,
+            }),
+            errors=errors,
+        )
\ No newline at end of file
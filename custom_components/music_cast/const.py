@@ -5,16 +5,92 @@ DOMAIN = "musiccast"
 DEFAULT_PORT = 8000
 DEFAULT_HOST = "localhost"
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_MAX_PAYLOAD_SIZE = 1024  # KiB
+DEFAULT_INVENTORY_INTERVAL = 30
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_DISCOVERY_TIMEOUT = 20
+DEFAULT_MAX_CONCURRENT_REQUESTS = 3
+DEFAULT_RATE_LIMIT_STREAMING = 12  # commands per minute
+DEFAULT_RATE_LIMIT_VOLUME = 120
+DEFAULT_RATE_LIMIT_SETTINGS = 30
+DEFAULT_RATE_LIMIT_DEVICE = 12
 
 # Configuration keys
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_MAX_PAYLOAD_SIZE = "max_payload_size"
+CONF_INVENTORY_INTERVAL = "inventory_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_DISCOVERY_TIMEOUT = "discovery_timeout"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_RATE_LIMIT_STREAMING = "rate_limit_streaming"
+CONF_RATE_LIMIT_VOLUME = "rate_limit_volume"
+CONF_RATE_LIMIT_SETTINGS = "rate_limit_settings"
+CONF_RATE_LIMIT_DEVICE = "rate_limit_device"
+CONF_STANDBY_SERVERS = "standby_servers"
+CONF_LONG_POLL = "long_poll"
+CONF_RECORD_TRAFFIC = "record_traffic"
+CONF_STREAM_WATCHDOG = "stream_watchdog"
 
 # Error messages
 ERROR_CANNOT_CONNECT = "cannot_connect"
 ERROR_INVALID_HOST = "invalid_host"
 ERROR_TIMEOUT = "timeout"
+ERROR_INVALID_STANDBY_SERVERS = "invalid_standby_servers"
+
+# Polling interval limits (seconds)
+SCAN_INTERVAL_MIN = 5
+SCAN_INTERVAL_MAX = 300
+INVENTORY_INTERVAL_MAX = 3600
+
+# Timeout limits (seconds)
+REQUEST_TIMEOUT_MIN = 1
+REQUEST_TIMEOUT_MAX = 60
+DISCOVERY_TIMEOUT_MAX = 120
+HEALTH_CHECK_TIMEOUT = 3
+
+# Long-poll status requests (seconds). The server holds a request until the
+# status changes or its own hold timeout expires, which must be shorter.
+LONG_POLL_TIMEOUT = 60
+LONG_POLL_BACKOFF_MIN = 1
+LONG_POLL_BACKOFF_MAX = 60
+
+# Traffic recording, written to <config>/musiccast/traffic_<entry id>.jsonl
+TRAFFIC_MAX_BYTES = 5 * 1024 * 1024
+TRAFFIC_BACKUPS = 2
+TRAFFIC_FLUSH_INTERVAL = 1  # seconds
+
+# Stream watchdog. A stream counts as stalled once every status seen for
+# WATCHDOG_STALL_WINDOW seconds, at least WATCHDOG_MIN_SAMPLES of them,
+# reports streaming to a connected cast device without audio server clients.
+# Recovery is attempted up to WATCHDOG_MAX_ATTEMPTS times, each waiting up
+# to WATCHDOG_RECOVERY_TIMEOUT seconds for clients, with backoff in between.
+WATCHDOG_STALL_WINDOW = 10
+WATCHDOG_MIN_SAMPLES = 3
+WATCHDOG_POLL_INTERVAL = 2
+WATCHDOG_RECOVERY_TIMEOUT = 15
+WATCHDOG_MAX_ATTEMPTS = 3
+WATCHDOG_BACKOFF_MIN = 5
+WATCHDOG_BACKOFF_MAX = 60
+
+# Concurrent requests per server
+MAX_CONCURRENT_REQUESTS_MAX = 10
+
+# Command classes, each rate limited by its own token bucket
+COMMAND_CLASS_STREAMING = "streaming"  # stream and auto detection start/stop
+COMMAND_CLASS_VOLUME = "volume"  # volume and mute
+COMMAND_CLASS_SETTINGS = "settings"  # threshold and silence timeout
+COMMAND_CLASS_DEVICE = "device"  # input selection, cast connection and discovery
+
+# Rate limits (commands per minute)
+RATE_LIMIT_MIN = 1
+RATE_LIMIT_MAX = 600
+RATE_LIMIT_BURST = 5
+
+# Response size limits (KiB)
+MAX_PAYLOAD_SIZE_MIN = 16
+MAX_PAYLOAD_SIZE_MAX = 65536
 
 # Audio threshold limits
 AUDIO_THRESHOLD_MIN = 0.001
@@ -24,6 +100,76 @@ AUDIO_THRESHOLD_MAX = 1.0
 SILENCE_TIMEOUT_MIN = 1.0
 SILENCE_TIMEOUT_MAX = 300.0
 
+# Threshold calibration. Input levels are sampled once per interval, noise
+# and signal are told apart by a jump of at least CALIBRATION_SIGNAL_GAP
+# between sorted levels, and without signal the threshold is set
+# CALIBRATION_NOISE_MARGIN above the noise floor. The silence timeout
+# outlasts the longest quiet gap within signal by CALIBRATION_TIMEOUT_MARGIN.
+DEFAULT_CALIBRATION_DURATION = 60
+CALIBRATION_DURATION_MIN = 10
+CALIBRATION_DURATION_MAX = 600
+CALIBRATION_SAMPLE_INTERVAL = 1
+CALIBRATION_MIN_SAMPLES = 10
+CALIBRATION_SIGNAL_GAP = 4.0
+CALIBRATION_NOISE_MARGIN = 2.0
+CALIBRATION_TIMEOUT_MARGIN = 1.5
+
 # Volume limits
 VOLUME_MIN = 0.0
-VOLUME_MAX = 1.0
\ No newline at end of file
+VOLUME_MAX = 1.0
+
+# Top-level fields of the /status document
+STATUS_FIELD_STREAMING = "streaming"
+STATUS_FIELD_AUTO_DETECTION = "auto_detection"
+STATUS_FIELD_CAST_DEVICE = "cast_device"
+STATUS_FIELD_AUDIO_SERVER = "audio_server"
+STATUS_FIELDS = frozenset({
+    STATUS_FIELD_STREAMING,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_AUDIO_SERVER,
+})
+
+# Number of recent refreshes used for health statistics
+HEALTH_WINDOW_SIZE = 60
+# Minimum seconds between state writes of health sensors
+HEALTH_SENSOR_MIN_WRITE_INTERVAL = 60
+
+# Polling interval used while wait_for_state requests are pending
+WAIT_FOR_STATE_POLL_INTERVAL = 1
+DEFAULT_WAIT_FOR_STATE_TIMEOUT = 30.0
+WAIT_FOR_STATE_TIMEOUT_MAX = 600.0
+
+# Profiling window limits (seconds)
+DEFAULT_PROFILING_DURATION = 60
+PROFILING_DURATION_MAX = 3600
+
+# Events
+EVENT_CAST_DEVICE_ADDED = f"{DOMAIN}_cast_device_added"
+EVENT_CAST_DEVICE_REMOVED = f"{DOMAIN}_cast_device_removed"
+EVENT_CAST_DEVICE_CHANGED = f"{DOMAIN}_cast_device_changed"
+EVENT_AUDIO_DEVICE_ADDED = f"{DOMAIN}_audio_device_added"
+EVENT_AUDIO_DEVICE_REMOVED = f"{DOMAIN}_audio_device_removed"
+EVENT_AUDIO_DEVICE_RESELECTED = f"{DOMAIN}_audio_device_reselected"
+EVENT_STREAM_STALLED = f"{DOMAIN}_stream_stalled"
+EVENT_STREAM_RECOVERED = f"{DOMAIN}_stream_recovered"
+EVENT_STREAM_RECOVERY_FAILED = f"{DOMAIN}_stream_recovery_failed"
+
+# Services
+SERVICE_WAIT_FOR_STATE = "wait_for_state"
+SERVICE_START_PROFILING = "start_profiling"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_CALIBRATE_THRESHOLD = "calibrate_threshold"
+
+# Service attributes
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_STREAMING = "streaming"
+ATTR_CAST_CONNECTED = "cast_connected"
+ATTR_CAST_DEVICE_UUID = "cast_device_uuid"
+ATTR_TIMEOUT = "timeout"
+ATTR_DURATION = "duration"
+ATTR_SCENE = "scene"
+
+# Scene saved and restored when none is named
+DEFAULT_SCENE = "default"
\ No newline at end of file
@@ -1,95 +1,511 @@
 """Coordinator for MusicCast integration."""
 
 import asyncio
+import contextlib
 import logging
-from datetime import timedelta
-from typing import Any, Dict, List, Optional
+import time
+import zlib
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
 import aiohttp
 import async_timeout
+from aiohttp import hdrs
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.json import json_loads_object
 
-from .const import CONF_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CALIBRATION_MIN_SAMPLES,
+    CALIBRATION_SAMPLE_INTERVAL,
+    CONF_DISCOVERY_TIMEOUT,
+    CONF_INVENTORY_INTERVAL,
+    CONF_LONG_POLL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_PAYLOAD_SIZE,
+    CONF_RATE_LIMIT_DEVICE,
+    CONF_RATE_LIMIT_SETTINGS,
+    CONF_RATE_LIMIT_STREAMING,
+    CONF_RATE_LIMIT_VOLUME,
+    CONF_RECORD_TRAFFIC,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SCAN_INTERVAL,
+    CONF_STANDBY_SERVERS,
+    CONF_STREAM_WATCHDOG,
+    DEFAULT_DISCOVERY_TIMEOUT,
+    DEFAULT_INVENTORY_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    COMMAND_CLASS_DEVICE,
+    COMMAND_CLASS_SETTINGS,
+    COMMAND_CLASS_STREAMING,
+    COMMAND_CLASS_VOLUME,
+    DEFAULT_MAX_PAYLOAD_SIZE,
+    DEFAULT_RATE_LIMIT_DEVICE,
+    DEFAULT_RATE_LIMIT_SETTINGS,
+    DEFAULT_RATE_LIMIT_STREAMING,
+    DEFAULT_RATE_LIMIT_VOLUME,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_AUDIO_DEVICE_ADDED,
+    EVENT_AUDIO_DEVICE_REMOVED,
+    EVENT_AUDIO_DEVICE_RESELECTED,
+    EVENT_CAST_DEVICE_ADDED,
+    EVENT_CAST_DEVICE_CHANGED,
+    EVENT_CAST_DEVICE_REMOVED,
+    HEALTH_CHECK_TIMEOUT,
+    LONG_POLL_BACKOFF_MAX,
+    LONG_POLL_BACKOFF_MIN,
+    LONG_POLL_TIMEOUT,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_STREAMING,
+    STATUS_FIELDS,
+    WAIT_FOR_STATE_POLL_INTERVAL,
+    WATCHDOG_POLL_INTERVAL,
+)
+from .calibration import Calibration
+from .inventory import CastDevice
+from .profiler import MusicCastProfiler
+from .ratelimit import TokenBucket, coalesce_key, command_class
+from .snapshot import SCENE_STATUS_FIELDS, VOLUME_TOLERANCE, MusicCastScene
+from .stats import MusicCastStats
+from .traffic import MusicCastTrafficRecorder
+from .watchdog import WATCHDOG_STATUS_FIELDS, MusicCastStreamWatchdog
+
+try:
+    import msgpack
+except ImportError:  # Optional, JSON is used without it
+    msgpack = None
 
 _LOGGER = logging.getLogger(__name__)
 
+StateCondition = Callable[[Dict[str, Any]], bool]
+
+# Session shared by all coordinators, see _async_get_session
+DATA_SESSION = f"{DOMAIN}_session"
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Compact formats are preferred, servers that ignore them answer plain JSON
+ACCEPT_HEADERS = {
+    hdrs.ACCEPT: "application/msgpack, application/json;q=0.9" if msgpack else "application/json",
+    hdrs.ACCEPT_ENCODING: "gzip, deflate",
+}
+
+# Audio inputs are identified by name, channels and sample rate, because the
+# index of an input changes when it is unplugged and re-enumerated
+AudioDeviceIdentity = Tuple[Optional[str], Optional[int], Optional[int]]
+
+# Status fields read by wait_for_state conditions
+WAIT_FOR_STATE_STATUS_FIELDS = frozenset({STATUS_FIELD_STREAMING, STATUS_FIELD_CAST_DEVICE})
+
+
+def audio_device_identity(device: Dict[str, Any]) -> AudioDeviceIdentity:
+    """Return the stable identity of an audio input device."""
+    return (device.get("name"), device.get("channels"), device.get("sample_rate"))
+
+
+def current_cast_device_uuid(data: Dict[str, Any]) -> Optional[str]:
+    """Return the UUID of the connected cast device in a coordinator snapshot."""
+    cast_device = data.get("status", {}).get("cast_device", {})
+    if not cast_device.get("connected", False):
+        return None
+
+    if cast_device.get("uuid"):
+        return cast_device["uuid"]
+
+    # Older servers only report the name of the connected device
+    device_name = cast_device.get("device_name")
+    for device in data.get("cast_devices", {}).values():
+        if device.name == device_name:
+            return device.uuid
+
+    return None
+
+
+@callback
+def _async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the session shared by all coordinators.
+
+    It leaves compressed bodies to the coordinator, which measures them on
+    the wire and enforces the payload limit while decompressing. It is
+    closed when Home Assistant stops rather than when the config entry that
+    created it is unloaded, which would close it for every entry.
+    """
+    if (session := hass.data.get(DATA_SESSION)) is None:
+        session = hass.data[DATA_SESSION] = async_create_clientsession(
+            hass, auto_cleanup=False, auto_decompress=False
+        )
+
+        @callback
+        def _async_close_session(_event: Event) -> None:
+            session.detach()
+            hass.data.pop(DATA_SESSION, None)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return session
+
+
+def wire_format(content_type: str, encoding: str) -> str:
+    """Return the name of a response format, such as json+gzip."""
+    name = "msgpack" if content_type in MSGPACK_CONTENT_TYPES else "json"
+    if encoding and encoding != "identity":
+        name = f"{name}+{encoding}"
+    return name
+
+
+def parse_standby_servers(value: str) -> List[str]:
+    """Return the base URLs of a comma separated list of host:port servers.
+
+    Raises ValueError for malformed entries.
+    """
+    urls = []
+    for server in value.split(","):
+        if not (server := server.strip()):
+            continue
+        host, _, port = server.rpartition(":")
+        if not host or not port.isdigit() or not 1 <= int(port) <= 65535:
+            raise ValueError(f"Invalid standby server {server}")
+        urls.append(f"http://{host}:{int(port)}")
+    return urls
+
 
 class MusicCastCoordinator(DataUpdateCoordinator):
     """Class to manage fetching MusicCast data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize coordinator."""
+        self.entry_id = entry.entry_id
         self.host = entry.data[CONF_HOST]
         self.port = entry.data[CONF_PORT]
-        self.base_url = f"http://{self.host}:{self.port}"
-        self.session = async_get_clientsession(hass)
+        self.primary_url = f"http://{self.host}:{self.port}"
+        # The server polling and commands go to, one of self.endpoints
+        self.base_url = self.primary_url
+        self.session = _async_get_session(hass)
+        # Shared by every entity of the entry
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"MusicCast ({self.host})",
+            manufacturer="MusicCast",
+            model="Audio Cast Server",
+            sw_version="1.0.0",
+            configuration_url=self.primary_url,
+        )
+        # Platforms forwarded for the entry, set up by async_setup_entry
+        self.platforms: List[Platform] = []
+        self.endpoint_latencies: Dict[str, Optional[float]] = {}
+        self._last_health_check = 0.0
+        # Settings to replay after switching servers
+        self._pending_replay: Optional[MusicCastScene] = None
+        self._long_poll_task: Optional[asyncio.Task] = None
+        # Whether long-poll requests are currently delivering status updates
+        self.long_poll_active = False
+        # Only set while traffic recording is enabled
+        self.traffic: Optional[MusicCastTrafficRecorder] = None
+        # Only set while the stream watchdog is enabled
+        self.watchdog: Optional[MusicCastStreamWatchdog] = None
+        self._unsub_watchdog_fields: Optional[CALLBACK_TYPE] = None
         
-        scan_interval = entry.data.get(CONF_SCAN_INTERVAL, 30)
+        self._apply_config({**entry.data, **entry.options})
+        self._state_waiters: List[Tuple[StateCondition, asyncio.Event]] = []
+        # Inventories are refetched after commands that change them
+        self._inventory_stale = True
+        self._last_inventory_fetch = 0.0
+        self._status_field_consumers: Dict[object, FrozenSet[str]] = {}
+        # Set when status fields may have been added to the request
+        self._status_fields_added = asyncio.Event()
+        # Version of the stored status, on servers supporting long-poll
+        self._status_version: Optional[int] = None
+        # Cast devices of the last inventory, keyed by UUID. The version is
+        # bumped whenever devices are added, removed or renamed.
+        self.cast_devices_by_uuid: Dict[str, CastDevice] = {}
+        self.cast_inventory_version = 0
+        self.cast_inventory_loaded = False
+        # Audio inputs of the last inventory, keyed by identity. The preferred
+        # input is the one last selected, and is reselected when it returns.
+        self.audio_devices_by_identity: Dict[AudioDeviceIdentity, Dict[str, Any]] = {}
+        self.preferred_audio_device: Optional[AudioDeviceIdentity] = None
+        self._audio_inventory_loaded = False
+        self._audio_reselect_task: Optional[asyncio.Task] = None
+        # Scenes saved by the snapshot service, kept in memory
+        self.scenes: Dict[str, MusicCastScene] = {}
+        self._connected_cast_uuid: Optional[str] = None
+        self._connected_cast_uuid_source: Optional[Dict[str, Any]] = None
+        self._pending_commands: Dict[str, asyncio.Future] = {}
+        # Rate limited commands waiting for a token, keyed by the setting
+        # they overwrite: [latest endpoint, shared future, timer]
+        self._deferred_commands: Dict[str, List[Any]] = {}
+        # Whether the server has a /batch endpoint, None until known
+        self.batch_supported: Optional[bool] = None
+        self.stats = MusicCastStats()
+        # Only set while profiling is enabled
+        self.profiler: Optional[MusicCastProfiler] = None
+        self._last_profiler: Optional[MusicCastProfiler] = None
+        self._unsub_profiler: Optional[CALLBACK_TYPE] = None
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=self._scan_interval,
         )
+        # Entities read from the snapshot before the first refresh completes
+        self.data: Dict[str, Any] = {}
 
-    async def async_setup(self) -> bool:
-        """Set up the coordinator."""
-        try:
-            await self._async_test_connection()
-            return True
-        except Exception as ex:
-            _LOGGER.error("Failed to setup MusicCast coordinator: %s", ex)
-            return False
+    def _apply_config(self, config: Mapping[str, Any]) -> None:
+        """Apply polling, timeout, concurrency and failover settings."""
+        self.endpoints = [
+            self.primary_url,
+            *parse_standby_servers(config.get(CONF_STANDBY_SERVERS, "")),
+        ]
+        if self.base_url not in self.endpoints:
+            self.base_url = self.primary_url
+        self._scan_interval = timedelta(
+            seconds=config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.inventory_interval = config.get(CONF_INVENTORY_INTERVAL, DEFAULT_INVENTORY_INTERVAL)
+        self.request_timeout = config.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+        self.discovery_timeout = config.get(CONF_DISCOVERY_TIMEOUT, DEFAULT_DISCOVERY_TIMEOUT)
+        self.max_payload_size = config.get(CONF_MAX_PAYLOAD_SIZE, DEFAULT_MAX_PAYLOAD_SIZE) * 1024
+        self.long_poll = config.get(CONF_LONG_POLL, False)
+        self.record_traffic = config.get(CONF_RECORD_TRAFFIC, False)
+        self.stream_watchdog = config.get(CONF_STREAM_WATCHDOG, False)
 
-    async def _async_test_connection(self) -> None:
-        """Test connection to MusicCast server."""
-        try:
-            with async_timeout.timeout(10):
-                async with self.session.get(f"{self.base_url}/") as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"Server returned status {response.status}")
-                    
-                    data = await response.json()
-                    if "MusicCast" not in data.get("message", ""):
-                        raise UpdateFailed("Invalid server response")
-        except asyncio.TimeoutError as ex:
-            raise UpdateFailed("Timeout connecting to server") from ex
-        except aiohttp.ClientError as ex:
-            raise UpdateFailed(f"Connection error: {ex}") from ex
+        max_concurrent_requests = config.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        if getattr(self, "max_concurrent_requests", None) != max_concurrent_requests:
+            # Requests in flight release the semaphore they acquired
+            self.max_concurrent_requests = max_concurrent_requests
+            self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        rate_limits = {
+            COMMAND_CLASS_STREAMING: config.get(CONF_RATE_LIMIT_STREAMING, DEFAULT_RATE_LIMIT_STREAMING),
+            COMMAND_CLASS_VOLUME: config.get(CONF_RATE_LIMIT_VOLUME, DEFAULT_RATE_LIMIT_VOLUME),
+            COMMAND_CLASS_SETTINGS: config.get(CONF_RATE_LIMIT_SETTINGS, DEFAULT_RATE_LIMIT_SETTINGS),
+            COMMAND_CLASS_DEVICE: config.get(CONF_RATE_LIMIT_DEVICE, DEFAULT_RATE_LIMIT_DEVICE),
+        }
+        if getattr(self, "rate_limits", None) != rate_limits:
+            self.rate_limits = rate_limits
+            self._token_buckets = {
+                command: TokenBucket(rate) for command, rate in rate_limits.items()
+            }
+
+    @callback
+    def async_apply_options(self, entry: ConfigEntry) -> None:
+        """Apply changed options to the running coordinator."""
+        self._apply_config({**entry.data, **entry.options})
+        self.async_update_long_poll()
+        self.async_update_traffic_recorder()
+        self.async_update_watchdog()
+        self._async_update_poll_interval()
+        _LOGGER.debug(
+            "Applied options to %s: scan interval %s, inventory interval %ss",
+            self.base_url, self._scan_interval, self.inventory_interval,
+        )
+
+    @callback
+    def async_update_long_poll(self) -> None:
+        """Start or stop the long-poll task to match the options."""
+        if self.long_poll and self._long_poll_task is None:
+            self._long_poll_task = self.hass.async_create_background_task(
+                self._async_long_poll(), f"{DOMAIN} long poll {self.entry_id}"
+            )
+        elif not self.long_poll and self._long_poll_task is not None:
+            self._long_poll_task.cancel()
+            self._long_poll_task = None
+            self._async_set_long_poll_active(False)
+
+    @callback
+    def async_update_traffic_recorder(self) -> None:
+        """Start or stop recording server traffic to match the options."""
+        if self.record_traffic and self.traffic is None:
+            self.traffic = MusicCastTrafficRecorder(
+                self.hass, self.hass.config.path(DOMAIN, f"traffic_{self.entry_id}.jsonl")
+            )
+            _LOGGER.info("Recording traffic of %s to %s", self.base_url, self.traffic.path)
+        elif not self.record_traffic and self.traffic is not None:
+            self.hass.async_create_background_task(
+                self.traffic.async_close(), f"{DOMAIN} close traffic recorder {self.entry_id}"
+            )
+            self.traffic = None
+
+    @callback
+    def async_update_watchdog(self) -> None:
+        """Start or stop the stream watchdog to match the options."""
+        if self.stream_watchdog and self.watchdog is None:
+            self.watchdog = MusicCastStreamWatchdog(self)
+            # Its fields are needed even when the entities reading them are disabled
+            self._unsub_watchdog_fields = self.async_register_status_fields(
+                MusicCastStreamWatchdog, WATCHDOG_STATUS_FIELDS
+            )
+        elif not self.stream_watchdog and self.watchdog is not None:
+            self.watchdog.async_stop()
+            self.watchdog = None
+            if self._unsub_watchdog_fields is not None:
+                self._unsub_watchdog_fields()
+                self._unsub_watchdog_fields = None
+            self._async_update_poll_interval()
+
+    async def _async_long_poll(self) -> None:
+        """Receive status changes through long-poll requests.
+
+        Each request passes the version of the last status and is answered
+        when the status changes or the server's hold timeout expires.
+        Updates go through the normal listener path without rescheduling
+        the regular refresh, which keeps running at the inventory interval
+        while long-poll works. Failures are retried with exponential
+        backoff, polling at the scan interval meanwhile.
+        """
+        backoff = LONG_POLL_BACKOFF_MIN
+        version = None
+        base_url = self.base_url
+        while True:
+            if base_url != self.base_url:
+                # Versions are only meaningful to the server that issued them
+                version = None
+                base_url = self.base_url
+
+            fields = self._requested_status_fields()
+            if fields is not None and not fields:
+                # No status field is consumed. Like _async_fetch_status,
+                # request none until one is.
+                self._status_fields_added.clear()
+                await self._status_fields_added.wait()
+                continue
+
+            params = {}
+            if version is not None:
+                params["wait"] = str(version)
+            if fields is not None:
+                params["fields"] = ",".join(sorted(fields))
+
+            try:
+                async with async_timeout.timeout(LONG_POLL_TIMEOUT + self.request_timeout):
+                    status = await self._async_fetch_json(
+                        "/status", params, concurrency_limited=False
+                    )
+            except Exception as ex:
+                _LOGGER.debug(
+                    "Long-poll request to %s failed, retrying in %ss: %s", base_url, backoff, ex
+                )
+                self._async_set_long_poll_active(False)
+                version = None
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, LONG_POLL_BACKOFF_MAX)
+                continue
+
+            if "version" not in status:
+                _LOGGER.warning(
+                    "%s does not support long-poll status requests, polling instead", base_url
+                )
+                self._async_set_long_poll_active(False)
+                self._long_poll_task = None
+                return
+
+            backoff = LONG_POLL_BACKOFF_MIN
+            self._async_set_long_poll_active(True)
+            new_version = status["version"]
+            if new_version != version and self.data:
+                self.data = {**self.data, "status": self._async_newest_status(status)}
+                self.last_update_success = True
+                self.async_update_listeners()
+            version = new_version
+
+    @callback
+    def _async_set_long_poll_active(self, active: bool) -> None:
+        """Relax regular polling while long-poll delivers status updates."""
+        if active != self.long_poll_active:
+            self.long_poll_active = active
+            self._async_update_poll_interval()
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from MusicCast server."""
+        start = time.perf_counter()
         try:
-            with async_timeout.timeout(10):
-                # Get status
-                async with self.session.get(f"{self.base_url}/status") as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"Status endpoint returned {response.status}")
-                    status_data = await response.json()
+            data = await self._async_fetch_data()
+        except UpdateFailed as ex:
+            self.stats.record_refresh(time.perf_counter() - start, str(ex))
+            raise
 
-                # Get audio devices
-                async with self.session.get(f"{self.base_url}/audio-devices") as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"Audio devices endpoint returned {response.status}")
-                    audio_devices_data = await response.json()
+        self.stats.record_refresh(time.perf_counter() - start)
+        return data
 
-                # Get cast devices
-                async with self.session.get(f"{self.base_url}/cast-devices") as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"Cast devices endpoint returned {response.status}")
-                    cast_devices_data = await response.json()
+    async def _async_fetch_data(self) -> Dict[str, Any]:
+        """Fetch data from the active server, failing over if it is down.
+
+        With standby servers configured, a failed refresh health checks all
+        servers and retries on the first healthy one in configured order.
+        While on a standby, the servers are checked again every
+        inventory_interval seconds to fail back.
+        """
+        if (
+            self.base_url != self.primary_url
+            and time.monotonic() - self._last_health_check >= self.inventory_interval
+        ):
+            await self._async_select_endpoint()
+
+        try:
+            data = await self._async_fetch_server_data()
+        except UpdateFailed:
+            if len(self.endpoints) < 2 or not await self._async_select_endpoint():
+                raise
+            data = await self._async_fetch_server_data()
+
+        if (scene := self._pending_replay) is not None:
+            # Runs once the new data is stored
+            self._pending_replay = None
+            self.hass.async_create_background_task(
+                self._async_replay_settings(scene), f"{DOMAIN} replay settings {self.base_url}"
+            )
+        return data
+
+    async def _async_fetch_server_data(self) -> Dict[str, Any]:
+        """Fetch status and inventories from the active server.
+
+        Status is fetched on every refresh, inventories only every
+        inventory_interval seconds or after a command changed them.
+        """
+        now = time.monotonic()
+        fetch_inventory = (
+            self._inventory_stale
+            or not self.data
+            or now - self._last_inventory_fetch >= self.inventory_interval
+        )
+
+        try:
+            async with async_timeout.timeout(self.request_timeout):
+                if not fetch_inventory:
+                    status = await self._async_fetch_status()
+                    return {**self.data, "status": self._async_newest_status(status)}
 
+                status_data, audio_devices_data, cast_devices_data = await asyncio.gather(
+                    self._async_fetch_status(),
+                    self._async_fetch_json("/audio-devices"),
+                    self._async_fetch_json("/cast-devices"),
+                )
+                status_data = self._async_newest_status(status_data)
+                self._inventory_stale = False
+                self._last_inventory_fetch = now
+                self._async_update_audio_inventory(audio_devices_data)
+                self._async_update_cast_inventory(cast_devices_data)
+
+                # The raw cast device list is dropped once parsed
                 return {
                     "status": status_data,
                     "audio_devices": audio_devices_data,
-                    "cast_devices": cast_devices_data,
+                    "cast_devices": self.cast_devices_by_uuid,
                 }
 
+        except UpdateFailed:
+            raise
         except asyncio.TimeoutError as ex:
             raise UpdateFailed("Timeout fetching data") from ex
         except aiohttp.ClientError as ex:
@@ -97,6 +513,499 @@ class MusicCastCoordinator(DataUpdateCoordinator):
         except Exception as ex:
             raise UpdateFailed(f"Unexpected error: {ex}") from ex
 
+    async def _async_select_endpoint(self) -> bool:
+        """Health check all servers concurrently and switch to the best one.
+
+        Servers are preferred in configured order. Returns whether the
+        active server changed.
+        """
+        self._last_health_check = time.monotonic()
+        latencies = await asyncio.gather(*(
+            self._async_check_endpoint(url) for url in self.endpoints
+        ))
+        self.endpoint_latencies = dict(zip(self.endpoints, latencies))
+
+        healthy = [url for url, latency in zip(self.endpoints, latencies) if latency is not None]
+        if not healthy or healthy[0] == self.base_url:
+            return False
+
+        _LOGGER.warning("Switching MusicCast server from %s to %s", self.base_url, healthy[0])
+        if self.data and self._pending_replay is None:
+            self._pending_replay = MusicCastScene.from_data(self.data, self.connected_cast_device_uuid)
+        self.base_url = healthy[0]
+        self.batch_supported = None
+        self._status_version = None
+        self._inventory_stale = True
+        self.stats.failovers += 1
+        return True
+
+    async def _async_check_endpoint(self, url: str) -> Optional[float]:
+        """Return the response time of a server, or None if it is down."""
+        server = self.endpoints.index(url)
+        start = time.perf_counter()
+        try:
+            async with async_timeout.timeout(min(self.request_timeout, HEALTH_CHECK_TIMEOUT)):
+                async with self.session.get(f"{url}/") as response:
+                    self._record_traffic("GET", "/", start, server=server, status=response.status)
+                    if response.status != 200:
+                        return None
+        except (asyncio.TimeoutError, aiohttp.ClientError) as ex:
+            self._record_traffic("GET", "/", start, server=server, error=str(ex) or type(ex).__name__)
+            return None
+        return time.perf_counter() - start
+
+    async def _async_replay_settings(self, scene: MusicCastScene) -> None:
+        """Apply the settings of the previous server to the new one."""
+        if not await self.async_restore_scene(scene):
+            _LOGGER.warning("Settings were only partially replayed to %s", self.base_url)
+
+    @callback
+    def _async_update_audio_inventory(self, audio_devices_data: Dict[str, Any]) -> None:
+        """Diff a fetched audio input list by identity and reselect the preferred input.
+
+        The preferred input is only reselected when it comes back, missing
+        from the previous inventory or at a different index, so inputs
+        selected on the server directly are left alone.
+        """
+        previous = self.audio_devices_by_identity
+        was_loaded = self._audio_inventory_loaded
+        index: Dict[AudioDeviceIdentity, Dict[str, Any]] = {}
+        current: Optional[AudioDeviceIdentity] = None
+        for device in audio_devices_data.get("devices", []):
+            identity = audio_device_identity(device)
+            index.setdefault(identity, device)
+            if device.get("index") == audio_devices_data.get("current_device"):
+                current = identity
+
+        self.audio_devices_by_identity = index
+        if self.preferred_audio_device is None:
+            self.preferred_audio_device = current
+
+        if not self._audio_inventory_loaded:
+            # The first inventory is not a change
+            self._audio_inventory_loaded = True
+        else:
+            for event_type, identities, devices in (
+                (EVENT_AUDIO_DEVICE_ADDED, [i for i in index if i not in previous], index),
+                (EVENT_AUDIO_DEVICE_REMOVED, [i for i in previous if i not in index], previous),
+            ):
+                for identity in identities:
+                    self.hass.bus.async_fire(
+                        event_type, self._audio_device_event_data(devices[identity])
+                    )
+
+        preferred = self.preferred_audio_device
+        if (
+            was_loaded
+            and preferred is not None
+            and preferred != current
+            and preferred in index
+            and (
+                preferred not in previous
+                or previous[preferred].get("index") != index[preferred].get("index")
+            )
+            and self._audio_reselect_task is None
+        ):
+            self._audio_reselect_task = self.hass.async_create_background_task(
+                self._async_reselect_audio_device(index[preferred]),
+                f"{DOMAIN} reselect audio device {self.base_url}",
+            )
+
+    async def _async_reselect_audio_device(self, device: Dict[str, Any]) -> None:
+        """Select the preferred audio input again at its new index."""
+        try:
+            _LOGGER.info(
+                "Reselecting audio input %s on %s at index %s",
+                device.get("name"), self.base_url, device.get("index"),
+            )
+            if await self._async_post_request(f"/audio-devices/{device.get('index')}"):
+                self._inventory_stale = True
+                self.hass.bus.async_fire(
+                    EVENT_AUDIO_DEVICE_RESELECTED, self._audio_device_event_data(device)
+                )
+        finally:
+            self._audio_reselect_task = None
+
+    def _audio_device_event_data(self, device: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the event data describing an audio input."""
+        return {
+            "config_entry_id": self.entry_id,
+            "index": device.get("index"),
+            "name": device.get("name"),
+            "channels": device.get("channels"),
+            "sample_rate": device.get("sample_rate"),
+        }
+
+    @callback
+    def _async_update_cast_inventory(self, cast_devices_data: Dict[str, Any]) -> None:
+        """Diff a fetched cast device list against the index and fire events.
+
+        Unchanged devices, and the whole index when nothing changed, keep
+        their previous objects, so entities reading them can skip writes.
+        """
+        previous = self.cast_devices_by_uuid
+        index: Dict[str, CastDevice] = {}
+        for raw_device in cast_devices_data.get("devices", []):
+            if raw_device.get("uuid") and raw_device["uuid"] not in index:
+                device = CastDevice.from_dict(raw_device)
+                if previous.get(device.uuid) == device:
+                    device = previous[device.uuid]
+                index[device.uuid] = device
+
+        added = [uuid for uuid in index if uuid not in previous]
+        removed = [uuid for uuid in previous if uuid not in index]
+        changed = [
+            uuid for uuid, device in index.items()
+            if uuid in previous and previous[uuid] is not device
+        ]
+        if not (added or removed or changed):
+            index = previous
+
+        self.cast_devices_by_uuid = index
+        if added or removed or any(
+            index[uuid].name != previous[uuid].name for uuid in changed
+        ):
+            self.cast_inventory_version += 1
+
+        if not self.cast_inventory_loaded:
+            # The first inventory is not a change
+            self.cast_inventory_loaded = True
+            return
+
+        for event_type, uuids, devices in (
+            (EVENT_CAST_DEVICE_ADDED, added, index),
+            (EVENT_CAST_DEVICE_REMOVED, removed, previous),
+            (EVENT_CAST_DEVICE_CHANGED, changed, index),
+        ):
+            for uuid in uuids:
+                self.hass.bus.async_fire(event_type, {
+                    "config_entry_id": self.entry_id,
+                    "uuid": uuid,
+                    "name": devices[uuid].name,
+                })
+
+        if added or removed:
+            _LOGGER.debug(
+                "Cast devices on %s changed: %d added, %d removed",
+                self.base_url, len(added), len(removed),
+            )
+
+    @property
+    def connected_cast_device_uuid(self) -> Optional[str]:
+        """Return the UUID of the connected cast device.
+
+        Resolved once per snapshot so per-device entities do not each search
+        the inventory.
+        """
+        data = self.data
+        if data is not self._connected_cast_uuid_source:
+            self._connected_cast_uuid = current_cast_device_uuid(data) if data else None
+            self._connected_cast_uuid_source = data
+        return self._connected_cast_uuid
+
+    @callback
+    def async_register_status_fields(
+        self, consumer: object, fields: FrozenSet[str]
+    ) -> CALLBACK_TYPE:
+        """Register the status fields a consumer reads.
+
+        Only registered fields are requested from the server.
+        """
+        self._status_field_consumers[consumer] = fields
+        self._status_fields_added.set()
+
+        @callback
+        def remove_consumer() -> None:
+            self._status_field_consumers.pop(consumer, None)
+
+        return remove_consumer
+
+    def _requested_status_fields(self) -> Optional[FrozenSet[str]]:
+        """Return the status fields to request, or None for the full document."""
+        if not self._status_field_consumers:
+            # Nothing registered yet (first refresh), fetch everything
+            return None
+
+        fields = frozenset().union(*self._status_field_consumers.values())
+        if self._state_waiters:
+            fields |= WAIT_FOR_STATE_STATUS_FIELDS
+
+        if fields >= STATUS_FIELDS:
+            return None
+        return fields
+
+    @callback
+    def _async_newest_status(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a fetched status, unless the stored one is newer.
+
+        Regular refreshes and long-poll requests run concurrently, so a
+        refresh may finish after long-poll stored a newer status. Fields
+        only the older status has are kept from it.
+        """
+        version = status.pop("version", None)
+        if version is None:
+            return status
+        if (
+            self._status_version is not None
+            and version < self._status_version
+            and self.data
+        ):
+            return {**status, **self.data.get("status", {})}
+        self._status_version = version
+        return status
+
+    async def _async_fetch_status(self) -> Dict[str, Any]:
+        """Fetch the fields of /status that enabled entities use."""
+        fields = self._requested_status_fields()
+        if fields is None:
+            return await self._async_fetch_json("/status")
+        if not fields:
+            return {}
+        return await self._async_fetch_json("/status", {"fields": ",".join(sorted(fields))})
+
+    async def _async_fetch_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        *,
+        concurrency_limited: bool = True,
+    ) -> Dict[str, Any]:
+        """GET an endpoint and decode its JSON body.
+
+        Requests held open by the server are not concurrency limited, so
+        they do not keep other requests waiting.
+        """
+        self.stats.record_request(endpoint)
+        start = time.perf_counter()
+        try:
+            async with (
+                self._request_semaphore if concurrency_limited else contextlib.nullcontext()
+            ):
+                start = time.perf_counter()
+                async with self.session.get(
+                    f"{self.base_url}{endpoint}", params=params, headers=ACCEPT_HEADERS
+                ) as response:
+                    if response.status != 200:
+                        self._record_traffic("GET", endpoint, start, params=params, status=response.status)
+                        raise UpdateFailed(f"{endpoint} endpoint returned {response.status}")
+                    body = await self._async_read_body(endpoint, response)
+                    content_type = response.content_type
+                    encoding = response.headers.get(hdrs.CONTENT_ENCODING, "").lower()
+            received = time.perf_counter()
+            self.stats.bytes_received += len(body)
+            self._record_traffic(
+                "GET", endpoint, start, params=params, status=200,
+                content_type=content_type, encoding=encoding, body=body,
+            )
+
+            decoded_size = 0
+            try:
+                data, decoded_size = self._decode_body(endpoint, body, content_type, encoding)
+                return data
+            finally:
+                decoded = time.perf_counter()
+                self.stats.decode_times[endpoint] = decoded - received
+                self.stats.record_response(
+                    wire_format(content_type, encoding), len(body), decoded_size, decoded - received
+                )
+                if (profiler := self.profiler) is not None:
+                    profiler.record("network", endpoint, received - start)
+                    profiler.record("decode", endpoint, decoded - received)
+        except Exception as ex:
+            self.stats.record_error(endpoint, str(ex) or type(ex).__name__)
+            if not isinstance(ex, UpdateFailed):
+                self._record_traffic("GET", endpoint, start, params=params, error=str(ex) or type(ex).__name__)
+            raise
+
+    def _record_traffic(self, method: str, endpoint: str, start: float, **exchange: Any) -> None:
+        """Record an exchange with the active server while traffic recording is enabled."""
+        if (traffic := self.traffic) is not None:
+            exchange.setdefault("server", self.endpoints.index(self.base_url))
+            traffic.record(method, endpoint, time.perf_counter() - start, **exchange)
+
+    async def _async_read_body(self, endpoint: str, response: aiohttp.ClientResponse) -> bytearray:
+        """Read a response body, enforcing the maximum payload size."""
+        limit = self.max_payload_size
+        if response.content_length is not None and response.content_length > limit:
+            raise UpdateFailed(
+                f"{endpoint} response of {response.content_length} bytes exceeds limit of {limit} bytes"
+            )
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(65536):
+            body += chunk
+            if len(body) > limit:
+                raise UpdateFailed(f"{endpoint} response exceeds limit of {limit} bytes")
+
+        return body
+
+    def _decode_body(
+        self, endpoint: str, body: bytes, content_type: str, encoding: str
+    ) -> Tuple[Dict[str, Any], int]:
+        """Decompress and decode a response body.
+
+        Returns the decoded object and the size of the uncompressed body.
+        """
+        if encoding in ("gzip", "deflate"):
+            body = self._decompress(endpoint, body, encoding)
+        elif encoding not in ("", "identity"):
+            raise UpdateFailed(f"{endpoint} response has unsupported encoding {encoding}")
+
+        try:
+            if content_type in MSGPACK_CONTENT_TYPES and msgpack is not None:
+                data = msgpack.unpackb(body)
+                if not isinstance(data, dict):
+                    raise ValueError(f"expected a map, got {type(data).__name__}")
+                return data, len(body)
+            return json_loads_object(body), len(body)
+        except ValueError as ex:
+            raise UpdateFailed(f"Invalid response from {endpoint}: {ex}") from ex
+
+    def _decompress(self, endpoint: str, body: bytes, encoding: str) -> bytes:
+        """Decompress a body, enforcing the maximum payload size on the result."""
+        limit = self.max_payload_size
+        # 47 accepts zlib and gzip headers, some servers send raw deflate
+        for wbits in (47,) if encoding == "gzip" else (47, -15):
+            decompressor = zlib.decompressobj(wbits)
+            try:
+                decoded = decompressor.decompress(body, limit + 1)
+            except zlib.error:
+                continue
+            if len(decoded) > limit or decompressor.unconsumed_tail:
+                raise UpdateFailed(f"{endpoint} response exceeds limit of {limit} bytes")
+            return decoded
+
+        raise UpdateFailed(f"Invalid {encoding} data from {endpoint}")
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners and resolve pending state waiters."""
+        if (profiler := self.profiler) is not None:
+            start = time.perf_counter()
+            super().async_update_listeners()
+            profiler.record("dispatch", "listeners", time.perf_counter() - start)
+        else:
+            super().async_update_listeners()
+        self._async_resolve_state_waiters()
+        if (watchdog := self.watchdog) is not None and self.last_update_success and self.data:
+            suspected = watchdog.suspected
+            watchdog.async_check(self.data)
+            if watchdog.suspected != suspected:
+                self._async_update_poll_interval()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and ignore new runs."""
+        self._async_stop_profiling()
+        if self._audio_reselect_task is not None:
+            self._audio_reselect_task.cancel()
+        if self._long_poll_task is not None:
+            self._long_poll_task.cancel()
+            self._long_poll_task = None
+        for _endpoint, future, unsub in self._deferred_commands.values():
+            unsub()
+            future.set_result(False)
+        self._deferred_commands.clear()
+        if self.watchdog is not None:
+            self.watchdog.async_stop()
+        if self.traffic is not None:
+            await self.traffic.async_close()
+            self.traffic = None
+        await super().async_shutdown()
+
+    @callback
+    def async_start_profiling(self, duration: float) -> None:
+        """Profile refreshes and entity state writes for `duration` seconds."""
+        self._async_stop_profiling()
+        self.profiler = MusicCastProfiler(duration)
+        self._unsub_profiler = async_call_later(
+            self.hass, duration, self._async_stop_profiling
+        )
+
+    @callback
+    def _async_stop_profiling(self, _now: Any = None) -> None:
+        """Stop profiling and keep the report for diagnostics."""
+        if self._unsub_profiler is not None:
+            self._unsub_profiler()
+            self._unsub_profiler = None
+
+        if self.profiler is not None:
+            self.profiler.stop()
+            self._last_profiler = self.profiler
+            self.profiler = None
+
+    def profile_report(self) -> Optional[Dict[str, Any]]:
+        """Return the report of the running or last profiling window."""
+        profiler = self.profiler or self._last_profiler
+        return profiler.report() if profiler is not None else None
+
+    @callback
+    def _async_resolve_state_waiters(self) -> None:
+        """Wake up waiters whose condition is met by the current data."""
+        if not self._state_waiters or not self.last_update_success or not self.data:
+            return
+
+        for condition, event in self._state_waiters:
+            if not event.is_set() and condition(self.data):
+                event.set()
+
+    @callback
+    def _async_update_poll_interval(self) -> None:
+        """Poll faster while state waiters are pending or a stall is suspected.
+
+        While long-poll delivers status updates, the regular refresh only
+        needs to keep the inventories current. A suspected stall is polled
+        regardless, because long-poll only delivers the change into it and
+        the watchdog needs samples over time.
+        """
+        if self.watchdog is not None and self.watchdog.suspected:
+            interval = min(self._scan_interval, timedelta(seconds=WATCHDOG_POLL_INTERVAL))
+        elif self.long_poll_active:
+            interval = max(self._scan_interval, timedelta(seconds=self.inventory_interval))
+        elif self._state_waiters:
+            interval = min(
+                self._scan_interval, timedelta(seconds=WAIT_FOR_STATE_POLL_INTERVAL)
+            )
+        else:
+            interval = self._scan_interval
+
+        if interval == self.update_interval:
+            return
+
+        self.update_interval = interval
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def async_wait_for_state(
+        self, condition: StateCondition, timeout: float
+    ) -> bool:
+        """Wait until the coordinator data satisfies a condition.
+
+        Returns False if the timeout expires first.
+        """
+        if self.last_update_success and self.data and condition(self.data):
+            return True
+
+        requested = self._requested_status_fields()
+        waiter = (condition, asyncio.Event())
+        self._state_waiters.append(waiter)
+        self._status_fields_added.set()
+        self._async_update_poll_interval()
+        if self._requested_status_fields() != requested:
+            # Fetch the fields conditions need now, a long-poll request
+            # without them may be held until the next change
+            self.hass.async_create_background_task(
+                self.async_request_refresh(), f"{DOMAIN} refresh state fields {self.entry_id}"
+            )
+
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._state_waiters.remove(waiter)
+            self._async_update_poll_interval()
+
     async def async_start_auto_detection(self) -> bool:
         """Start automatic audio detection."""
         return await self._async_post_request("/auto-detection/start")
@@ -141,36 +1050,388 @@ class MusicCastCoordinator(DataUpdateCoordinator):
         """Set silence timeout."""
         return await self._async_post_request(f"/auto-detection/silence-timeout/{timeout}")
 
+    async def async_calibrate_threshold(self, duration: float) -> Calibration:
+        """Calibrate the audio threshold and silence timeout from input levels.
+
+        The input level auto detection compares with the threshold is
+        sampled from /status for `duration` seconds. Both settings are then
+        sent together, followed by a single refresh. Raises UpdateFailed when
+        the server does not report input levels, too few samples could be
+        taken or the settings could not be applied.
+        """
+        levels: List[float] = []
+        params = {"fields": STATUS_FIELD_AUTO_DETECTION}
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            try:
+                async with async_timeout.timeout(self.request_timeout):
+                    status = await self._async_fetch_json("/status", params)
+            except (asyncio.TimeoutError, aiohttp.ClientError, UpdateFailed) as ex:
+                _LOGGER.debug("Skipped an input level sample of %s: %s", self.base_url, ex)
+            else:
+                level = status.get(STATUS_FIELD_AUTO_DETECTION, {}).get("level")
+                if not isinstance(level, (int, float)):
+                    raise UpdateFailed(f"{self.base_url} does not report input levels")
+                levels.append(level)
+            await asyncio.sleep(CALIBRATION_SAMPLE_INTERVAL)
+
+        if len(levels) < CALIBRATION_MIN_SAMPLES:
+            raise UpdateFailed(f"Only {len(levels)} input levels could be sampled from {self.base_url}")
+
+        calibration = Calibration.from_levels(levels, CALIBRATION_SAMPLE_INTERVAL)
+        stage = [f"/auto-detection/threshold/{calibration.threshold}"]
+        if calibration.silence_timeout is not None:
+            stage.append(f"/auto-detection/silence-timeout/{calibration.silence_timeout}")
+        results = await self.async_execute_batch([stage])
+        await self.async_refresh()
+        if not all(results):
+            raise UpdateFailed(f"Calibrated settings could not be applied to {self.base_url}")
+        return calibration
+
     async def async_set_audio_device(self, device_index: int) -> bool:
-        """Set audio input device."""
+        """Set audio input device.
+
+        The device becomes the preferred input that is reselected
+        automatically after it is unplugged and comes back.
+        """
+        for device in (self.data or {}).get("audio_devices", {}).get("devices", []):
+            if device.get("index") == device_index:
+                self.preferred_audio_device = audio_device_identity(device)
+                break
+        self._inventory_stale = True
         return await self._async_post_request(f"/audio-devices/{device_index}")
 
     async def async_connect_cast_device(self, device_uuid: str) -> bool:
         """Connect to a cast device."""
         return await self._async_post_request(f"/cast-devices/{device_uuid}/connect")
 
+    async def async_snapshot_scene(self, name: str) -> MusicCastScene:
+        """Save the current setup of the server as scene `name`."""
+        requested = self._requested_status_fields()
+        if requested is not None and not SCENE_STATUS_FIELDS <= requested:
+            # Entities reading these fields may be disabled, request them
+            # from now on so scenes can be captured and compared
+            self.async_register_status_fields(MusicCastScene, SCENE_STATUS_FIELDS)
+            await self.async_refresh()
+
+        scene = MusicCastScene.from_data(self.data or {}, self.connected_cast_device_uuid)
+        self.scenes[name] = scene
+        return scene
+
+    async def async_restore_scene(self, scene: MusicCastScene) -> bool:
+        """Bring the server back to a scene with as few commands as possible.
+
+        Only settings that differ from the current state are sent. The input
+        and cast device are switched first, in order, because volume and mute
+        apply to the connected cast device; the remaining settings are
+        independent of each other. Auto detection is switched last so it
+        does not start streaming to the old target. The commands go out as
+        one batch and one refresh runs at the end.
+        """
+        current = MusicCastScene.from_data(self.data or {}, self.connected_cast_device_uuid)
+        stages: List[List[str]] = []
+        missing_input = False
+
+        if scene.audio_device is not None and scene.audio_device != current.audio_device:
+            if (device := self.audio_devices_by_identity.get(scene.audio_device)) is None:
+                _LOGGER.warning("Audio input %s of the scene is not available", scene.audio_device[0])
+                missing_input = True
+            else:
+                self.preferred_audio_device = scene.audio_device
+                self._inventory_stale = True
+                stages.append([f"/audio-devices/{device['index']}"])
+
+        cast_device_changed = (
+            scene.cast_device_uuid is not None
+            and scene.cast_device_uuid != current.cast_device_uuid
+        )
+        if cast_device_changed:
+            stages.append([f"/cast-devices/{scene.cast_device_uuid}/connect"])
+
+        settings = []
+        if scene.threshold is not None and scene.threshold != current.threshold:
+            settings.append(f"/auto-detection/threshold/{scene.threshold}")
+        if scene.silence_timeout is not None and scene.silence_timeout != current.silence_timeout:
+            settings.append(f"/auto-detection/silence-timeout/{scene.silence_timeout}")
+        # The current volume and mute belong to the previous cast device
+        if scene.volume_level is not None and (
+            cast_device_changed
+            or current.volume_level is None
+            or abs(scene.volume_level - current.volume_level) > VOLUME_TOLERANCE
+        ):
+            settings.append(f"/volume/{scene.volume_level}")
+        if scene.is_muted is not None and (cast_device_changed or scene.is_muted != current.is_muted):
+            settings.append("/mute" if scene.is_muted else "/unmute")
+        if settings:
+            stages.append(settings)
+
+        if (
+            scene.auto_detection_enabled is not None
+            and scene.auto_detection_enabled != current.auto_detection_enabled
+        ):
+            stages.append([
+                "/auto-detection/enable" if scene.auto_detection_enabled else "/auto-detection/disable"
+            ])
+
+        if not stages:
+            return not missing_input
+
+        results = await self.async_execute_batch(stages)
+        await self.async_refresh()
+        return all(results) and not missing_input
+
     async def async_refresh_cast_devices(self) -> bool:
         """Refresh cast devices list."""
+        if not self._token_buckets[COMMAND_CLASS_DEVICE].try_acquire():
+            self._reject_command("/cast-devices?refresh=true")
+            return False
+
+        self._inventory_stale = True
+        self.stats.record_request("/cast-devices?refresh=true")
+        start = time.perf_counter()
         try:
-            with async_timeout.timeout(20):  # Discovery can take longer
-                async with self.session.get(f"{self.base_url}/cast-devices?refresh=true") as response:
+            async with async_timeout.timeout(self.discovery_timeout):  # Discovery can take longer
+                async with self._request_semaphore, self.session.get(f"{self.base_url}/cast-devices?refresh=true") as response:
+                    self._record_traffic("GET", "/cast-devices?refresh=true", start, status=response.status)
+                    if response.status != 200:
+                        self.stats.record_error("/cast-devices?refresh=true", f"status {response.status}")
                     return response.status == 200
         except Exception as ex:
             _LOGGER.error("Failed to refresh cast devices: %s", ex)
+            self._record_traffic("GET", "/cast-devices?refresh=true", start, error=str(ex) or type(ex).__name__)
+            self.stats.record_error("/cast-devices?refresh=true", str(ex) or type(ex).__name__)
             return False
 
+    async def async_execute_batch(self, stages: Sequence[Sequence[str]]) -> List[bool]:
+        """Send commands and return whether each one succeeded, in order.
+
+        Commands are grouped in stages that run in order, the commands of a
+        stage being independent of each other. All commands are sent as one
+        request to the server's /batch endpoint, which applies them in
+        order. Servers without it get one POST per command on the session's
+        pooled keep-alive connections, concurrently within a stage.
+
+        Every command takes a token of its command class first. Commands
+        beyond the rate limit are left out and deferred or rejected, as
+        single commands are.
+        """
+        endpoints = [endpoint for stage in stages for endpoint in stage]
+        results: List[bool] = [False] * len(endpoints)
+        admitted: List[int] = []
+        throttled: Dict[int, Awaitable[bool]] = {}
+        for position, endpoint in enumerate(endpoints):
+            if (key := coalesce_key(endpoint)) in self._deferred_commands or (
+                not self._token_buckets[command_class(endpoint)].try_acquire()
+            ):
+                throttled[position] = self._async_defer_or_reject(endpoint, key)
+            else:
+                admitted.append(position)
+
+        outcomes = await asyncio.gather(
+            self._async_send_admitted(stages, endpoints, admitted, results),
+            *throttled.values(),
+        )
+        for position, success in zip(throttled, outcomes[1:]):
+            results[position] = success
+        return results
+
+    async def _async_send_admitted(
+        self,
+        stages: Sequence[Sequence[str]],
+        endpoints: Sequence[str],
+        admitted: Sequence[int],
+        results: List[bool],
+    ) -> None:
+        """Send the commands of a batch that got a token, storing their results."""
+        if len(admitted) > 1 and self.batch_supported is not False:
+            batch = await self._async_send_batch([endpoints[position] for position in admitted])
+            if batch is not None:
+                self.stats.commands_issued += len(admitted)
+                for position, success in zip(admitted, batch):
+                    results[position] = success
+                return
+
+        admitted_positions = set(admitted)
+        start = 0
+        for stage in stages:
+            positions = [
+                position for position in range(start, start + len(stage))
+                if position in admitted_positions
+            ]
+            start += len(stage)
+            stage_results = await asyncio.gather(*(
+                self._async_send_command(endpoints[position]) for position in positions
+            ))
+            for position, success in zip(positions, stage_results):
+                results[position] = success
+
+    async def _async_send_batch(self, endpoints: Sequence[str]) -> Optional[List[bool]]:
+        """Send commands to the /batch endpoint.
+
+        Returns None when the server does not support batches.
+        """
+        self.stats.record_request("/batch")
+        payload = {"commands": [{"method": "POST", "path": endpoint} for endpoint in endpoints]}
+        start = time.perf_counter()
+        try:
+            async with async_timeout.timeout(self.request_timeout):
+                async with self._request_semaphore, self.session.post(
+                    f"{self.base_url}/batch", json=payload
+                ) as response:
+                    if response.status != 200:
+                        self._record_traffic("POST", "/batch", start, request=payload, status=response.status)
+                    if response.status in (404, 405, 501):
+                        _LOGGER.debug("%s does not support batches, sending commands one by one", self.base_url)
+                        self.batch_supported = False
+                        return None
+                    if response.status != 200:
+                        raise UpdateFailed(f"/batch endpoint returned {response.status}")
+                    body = await self._async_read_body("/batch", response)
+                    content_type = response.content_type
+                    encoding = response.headers.get(hdrs.CONTENT_ENCODING, "").lower()
+                    self._record_traffic(
+                        "POST", "/batch", start, request=payload, status=200,
+                        content_type=content_type, encoding=encoding, body=body,
+                    )
+
+            batch, _ = self._decode_body("/batch", body, content_type, encoding)
+            results = batch.get("results")
+            if not isinstance(results, list) or len(results) != len(endpoints):
+                raise UpdateFailed("/batch endpoint returned unexpected results")
+        except Exception as ex:
+            # The server may have applied part of the batch, so it is not resent
+            _LOGGER.error("Failed batch request of %d commands: %s", len(endpoints), ex)
+            if not isinstance(ex, UpdateFailed):
+                self._record_traffic("POST", "/batch", start, request=payload, error=str(ex) or type(ex).__name__)
+            self.stats.record_error("/batch", str(ex) or type(ex).__name__)
+            return [False] * len(endpoints)
+
+        self.batch_supported = True
+        outcome = []
+        for endpoint, result in zip(endpoints, results):
+            success = isinstance(result, dict) and result.get("status") == 200
+            if not success:
+                _LOGGER.warning("Batched command %s failed: %s", endpoint, result)
+                self.stats.record_error(endpoint, f"batch result {result}")
+            outcome.append(success)
+        return outcome
+
     async def _async_post_request(self, endpoint: str) -> bool:
-        """Make a POST request to the server."""
+        """Make a POST request to the server.
+
+        An identical request issued while one is in flight shares its result
+        instead of being sent again. Requests beyond the rate limit of their
+        command class are deferred or rejected.
+        """
+        if (pending := self._pending_commands.get(endpoint)) is not None:
+            self.stats.commands_coalesced += 1
+            return await asyncio.shield(pending)
+
+        if (key := coalesce_key(endpoint)) in self._deferred_commands or (
+            not self._token_buckets[command_class(endpoint)].try_acquire()
+        ):
+            return await self._async_defer_or_reject(endpoint, key)
+
+        return await self._async_send_command(endpoint)
+
+    async def _async_send_command(self, endpoint: str) -> bool:
+        """Send a command that got its token, sharing an identical one in flight."""
+        if (pending := self._pending_commands.get(endpoint)) is not None:
+            self.stats.commands_coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.stats.commands_issued += 1
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._pending_commands[endpoint] = future
+        try:
+            success = await self._async_send_post(endpoint)
+        except BaseException:
+            future.set_result(False)
+            raise
+        finally:
+            del self._pending_commands[endpoint]
+
+        future.set_result(success)
+        return success
+
+    async def _async_defer_or_reject(self, endpoint: str, key: Optional[str]) -> bool:
+        """Handle a command that exceeds its rate limit.
+
+        Commands overwriting a setting are deferred until a token is
+        available, and a later value for the same setting replaces the
+        waiting one. Other commands are rejected.
+        """
+        if key is None:
+            self._reject_command(endpoint)
+            return False
+
+        self.stats.commands_deferred += 1
+        if (deferred := self._deferred_commands.get(key)) is not None:
+            deferred[0] = endpoint  # The latest value wins
+            return await asyncio.shield(deferred[1])
+
+        future: asyncio.Future = self.hass.loop.create_future()
+        unsub = async_call_later(
+            self.hass,
+            self._token_buckets[command_class(endpoint)].delay(),
+            partial(self._async_send_deferred, key),
+        )
+        self._deferred_commands[key] = [endpoint, future, unsub]
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_send_deferred(self, key: str, _now: datetime) -> None:
+        """Send the latest deferred command for a setting."""
+        self.hass.async_create_background_task(
+            self._async_flush_deferred(key), f"{DOMAIN} deferred command {self.base_url}"
+        )
+
+    async def _async_flush_deferred(self, key: str) -> None:
+        """Send a deferred command and resolve everyone waiting for it."""
+        deferred = self._deferred_commands[key]
+        bucket = self._token_buckets[command_class(deferred[0])]
+        if not bucket.try_acquire():
+            # Another command of the class took the token, wait for the next
+            deferred[2] = async_call_later(
+                self.hass, bucket.delay(), partial(self._async_send_deferred, key)
+            )
+            return
+
+        endpoint, future, _unsub = self._deferred_commands.pop(key)
+        self.stats.commands_issued += 1
+        success = False
+        try:
+            success = await self._async_send_post(endpoint)
+        finally:
+            future.set_result(success)
+
+    def _reject_command(self, endpoint: str) -> None:
+        """Log and count a command rejected by rate limiting."""
+        command = command_class(endpoint)
+        self.stats.commands_rejected[command] += 1
+        _LOGGER.warning(
+            "Rejected %s on %s: more than %s %s commands per minute",
+            endpoint, self.base_url, self.rate_limits[command], command,
+        )
+
+    async def _async_send_post(self, endpoint: str) -> bool:
+        """Send a POST request to the server."""
+        self.stats.record_request(endpoint)
+        start = time.perf_counter()
         try:
-            with async_timeout.timeout(10):
-                async with self.session.post(f"{self.base_url}{endpoint}") as response:
+            async with async_timeout.timeout(self.request_timeout):
+                async with self._request_semaphore, self.session.post(f"{self.base_url}{endpoint}") as response:
+                    self._record_traffic("POST", endpoint, start, status=response.status)
                     success = response.status == 200
                     if not success:
                         _LOGGER.warning(
                             "POST request to %s failed with status %s", 
                             endpoint, response.status
                         )
+                        self.stats.record_error(endpoint, f"status {response.status}")
                     return success
         except Exception as ex:
             _LOGGER.error("Failed POST request to %s: %s", endpoint, ex)
+            self._record_traffic("POST", endpoint, start, error=str(ex) or type(ex).__name__)
+            self.stats.record_error(endpoint, str(ex) or type(ex).__name__)
             return False
\ No newline at end of file
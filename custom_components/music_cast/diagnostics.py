@@ -0,0 +1,79 @@
+"""Diagnostics support for MusicCast integration."""
+
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_HOST, CONF_PORT, CONF_STANDBY_SERVERS, DOMAIN
+from .coordinator import MusicCastCoordinator
+
+TO_REDACT = {
+    CONF_HOST,
+    CONF_PORT,
+    CONF_STANDBY_SERVERS,
+    "ip",
+    "ip_address",
+    "title",
+    "unique_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MusicCastCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    hosts = [urlsplit(url).hostname or "" for url in coordinator.endpoints]
+    stats = coordinator.stats.as_dict()
+    stats["last_error"] = _redact_hosts(stats["last_error"], hosts)
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": _redact_hosts(
+                str(coordinator.last_exception) if coordinator.last_exception else None,
+                hosts,
+            ),
+            "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+            "max_payload_size": coordinator.max_payload_size,
+            "long_poll_active": coordinator.long_poll_active,
+            "recorded_exchanges": coordinator.traffic.records if coordinator.traffic else None,
+            "stream_stall_suspected": coordinator.watchdog.suspected if coordinator.watchdog else None,
+            "preferred_audio_device": coordinator.preferred_audio_device,
+            # Servers are listed by position, 0 being the primary
+            "active_server": coordinator.endpoints.index(coordinator.base_url),
+            "server_latencies": [
+                coordinator.endpoint_latencies.get(url) for url in coordinator.endpoints
+            ],
+        },
+        "stats": stats,
+        "profile": coordinator.profile_report(),
+        "data": async_redact_data(_data_as_dict(coordinator.data or {}), TO_REDACT),
+    }
+
+
+def _data_as_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return coordinator data with the cast devices as plain dicts, so they get redacted."""
+    if "cast_devices" not in data:
+        return data
+    return {
+        **data,
+        "cast_devices": {
+            "devices": [device.as_dict() for device in data["cast_devices"].values()],
+        },
+    }
+
+
+def _redact_hosts(message: Optional[str], hosts: Iterable[str]) -> Optional[str]:
+    """Remove the server hosts from an error message."""
+    if message is None:
+        return None
+    for host in hosts:
+        if host:
+            message = message.replace(host, REDACTED)
+    return message
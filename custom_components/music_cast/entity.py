@@ -0,0 +1,166 @@
+"""Base entity for MusicCast integration."""
+
+import time
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import MusicCastCoordinator
+
+DATA_STATE_WRITER = f"{DOMAIN}_state_writer"
+
+
+class MusicCastStateWriter:
+    """Write the states of updated entities together in one loop tick.
+
+    Entities of every MusicCast coordinator updated in the same tick are
+    written by a single call_soon callback instead of one after another
+    from each coordinator's listeners.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self._hass = hass
+        # Insertion ordered set of entities waiting for a write
+        self._pending: Dict["MusicCastEntity", None] = {}
+        self._scheduled = False
+
+    @callback
+    def async_schedule(self, entity: "MusicCastEntity") -> None:
+        """Write the state of an entity in the next flush."""
+        self._pending[entity] = None
+        if not self._scheduled:
+            self._scheduled = True
+            self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_discard(self, entity: "MusicCastEntity") -> None:
+        """Drop a pending write of a removed entity."""
+        self._pending.pop(entity, None)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write all pending states."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for entity in pending:
+            entity.async_write_ha_state()
+
+
+@callback
+def async_get_state_writer(hass: HomeAssistant) -> MusicCastStateWriter:
+    """Return the state writer shared by all MusicCast entities."""
+    if (writer := hass.data.get(DATA_STATE_WRITER)) is None:
+        writer = hass.data[DATA_STATE_WRITER] = MusicCastStateWriter(hass)
+    return writer
+
+
+class MusicCastEntity(CoordinatorEntity, RestoreEntity):
+    """Base class for MusicCast entities.
+
+    Until the coordinator has fetched data from the server, entities show
+    the state they had before Home Assistant restarted. Platforms restore
+    their `_attr_*` values from it in `_async_restore_last_state`, and their
+    properties return those while `restoring`.
+    """
+
+    coordinator: MusicCastCoordinator
+
+    # Top-level fields of the /status document read by this entity
+    _status_fields: FrozenSet[str] = frozenset()
+
+    # Inventory sections of the coordinator data read by this entity
+    _data_sections: FrozenSet[str] = frozenset()
+
+    # State-write properties timed while profiling is enabled
+    _profiled_properties: Tuple[str, ...] = ("state", "extra_state_attributes")
+
+    _restored = False
+    _last_inputs: Optional[Tuple[Any, ...]] = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register the status fields this entity needs and restore its state."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_register_status_fields(self, self._status_fields)
+        )
+        writer = async_get_state_writer(self.hass)
+        self.async_on_remove(lambda: writer.async_discard(self))
+
+        if self.coordinator.data:
+            return
+
+        last_state = await self.async_get_last_state()
+        if last_state is not None and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._restored = True
+            await self._async_restore_last_state(last_state)
+
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore the values shown until the first refresh."""
+
+    @property
+    def restoring(self) -> bool:
+        """Return whether restored values are shown instead of server data."""
+        return (
+            self._restored
+            and not self.coordinator.data
+            and self.coordinator.last_update_success
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.restoring or (
+            self.coordinator.last_update_success and bool(self.coordinator.data)
+        )
+
+    def _state_inputs(self) -> Tuple[Any, ...]:
+        """Return the coordinator data the state of this entity is computed from."""
+        data = self.coordinator.data
+        status = data.get("status", {}) if data else {}
+        return (
+            self.coordinator.last_update_success,
+            bool(data),
+            tuple(status.get(field) for field in self._status_fields),
+            # Unchanged inventories are the same objects, compared by identity
+            tuple(data.get(section) for section in self._data_sections) if data else (),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Queue a state write unless the data this entity reads is unchanged."""
+        inputs = self._state_inputs()
+        if inputs == self._last_inputs:
+            self.coordinator.stats.entity_writes_skipped += 1
+            return
+
+        self._last_inputs = inputs
+        self._async_schedule_write()
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Write the state together with other updated entities."""
+        async_get_state_writer(self.hass).async_schedule(self)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine, counting and profiling it."""
+        self.coordinator.stats.entity_state_writes += 1
+
+        if (profiler := self.coordinator.profiler) is None:
+            super().async_write_ha_state()
+            return
+
+        section = f"entity {type(self).__name__}"
+        for name in self._profiled_properties:
+            start = time.perf_counter()
+            getattr(self, name)
+            profiler.record(section, name, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        super().async_write_ha_state()
+        profiler.record(section, "async_write_ha_state", time.perf_counter() - start)
@@ -0,0 +1,44 @@
+"""Compact cast device inventory for MusicCast integration."""
+
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+
+def _intern(value: Any) -> Any:
+    """Share one copy of a string repeated across devices and refreshes."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class CastDevice:
+    """Cast device of the server's inventory.
+
+    Kept instead of the raw /cast-devices payload. Model, manufacturer and
+    cast type repeat across devices, so a single copy of each is shared.
+    """
+
+    uuid: str
+    name: Optional[str] = None
+    model_name: Optional[str] = None
+    manufacturer: Optional[str] = None
+    cast_type: Optional[str] = None
+    host: Optional[str] = None
+    port: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, device: Dict[str, Any]) -> "CastDevice":
+        """Parse a device of a /cast-devices document."""
+        return cls(
+            uuid=device["uuid"],
+            name=device.get("name"),
+            model_name=_intern(device.get("model_name")),
+            manufacturer=_intern(device.get("manufacturer")),
+            cast_type=_intern(device.get("cast_type")),
+            host=device.get("host"),
+            port=device.get("port"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the device as a plain dict."""
+        return asdict(self)
\ No newline at end of file
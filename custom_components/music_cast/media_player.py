@@ -1,21 +1,28 @@
 """Media player entity for MusicCast integration."""
 
 import logging
+from contextlib import suppress
 from typing import Any, Dict, Optional
 
 from homeassistant.components.media_player import (
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_STREAMING,
+)
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,7 +38,7 @@ async def async_setup_entry(
     async_add_entities([MusicCastMediaPlayer(coordinator, entry)])
 
 
-class MusicCastMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
+class MusicCastMediaPlayer(MusicCastEntity, MediaPlayerEntity):
     """Representation of a MusicCast media player."""
 
     _attr_has_entity_name = True
@@ -42,26 +49,36 @@ class MusicCastMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         | MediaPlayerEntityFeature.TURN_ON
         | MediaPlayerEntityFeature.TURN_OFF
     )
+    _status_fields = frozenset({
+        STATUS_FIELD_STREAMING,
+        STATUS_FIELD_AUTO_DETECTION,
+        STATUS_FIELD_CAST_DEVICE,
+    })
+    _data_sections = frozenset({"audio_devices"})
+    _profiled_properties = ("state", "state_attributes", "extra_state_attributes")
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the media player."""
         super().__init__(coordinator)
         
         self._attr_unique_id = f"{entry.entry_id}_media_player"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
+        self._attr_device_info = coordinator.device_info
+
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore the state and volume."""
+        with suppress(ValueError):
+            self._attr_state = MediaPlayerState(last_state.state)
+        self._attr_volume_level = last_state.attributes.get(ATTR_MEDIA_VOLUME_LEVEL)
+        self._attr_is_volume_muted = last_state.attributes.get(ATTR_MEDIA_VOLUME_MUTED)
 
     @property
-    def state(self) -> MediaPlayerState:
+    def state(self) -> Optional[MediaPlayerState]:
         """Return the state of the media player."""
+        if self.restoring:
+            return super().state
         if not self.coordinator.last_update_success:
-            return MediaPlayerState.UNAVAILABLE
+            # Reported as unavailable through `available`
+            return None
 
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
@@ -81,6 +98,8 @@ class MusicCastMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def volume_level(self) -> Optional[float]:
         """Volume level of the media player (0..1)."""
+        if self.restoring:
+            return super().volume_level
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         return cast_device.get("volume_level")
@@ -88,6 +107,8 @@ class MusicCastMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def is_volume_muted(self) -> Optional[bool]:
         """Boolean if volume is currently muted."""
+        if self.restoring:
+            return super().is_volume_muted
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         return cast_device.get("is_muted")
@@ -126,6 +147,8 @@ class MusicCastMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         auto_detection = status.get("auto_detection", {})
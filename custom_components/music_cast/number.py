@@ -1,14 +1,14 @@
 """Number entities for MusicCast integration."""
 
 import logging
+from contextlib import suppress
 from typing import Optional
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -16,8 +16,10 @@ from .const import (
     AUDIO_THRESHOLD_MAX,
     SILENCE_TIMEOUT_MIN,
     SILENCE_TIMEOUT_MAX,
+    STATUS_FIELD_AUTO_DETECTION,
 )
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ async def async_setup_entry(
     ])
 
 
-class MusicCastNumberBase(CoordinatorEntity, NumberEntity):
+class MusicCastNumberBase(MusicCastEntity, NumberEntity):
     """Base class for MusicCast number entities."""
 
     _attr_has_entity_name = True
@@ -47,19 +49,12 @@ class MusicCastNumberBase(CoordinatorEntity, NumberEntity):
         """Initialize the number entity."""
         super().__init__(coordinator)
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore the value."""
+        with suppress(ValueError):
+            self._attr_native_value = float(last_state.state)
 
 
 class MusicCastAudioThresholdNumber(MusicCastNumberBase):
@@ -71,6 +66,7 @@ class MusicCastAudioThresholdNumber(MusicCastNumberBase):
     _attr_native_max_value = AUDIO_THRESHOLD_MAX
     _attr_native_step = 0.001
     _attr_native_unit_of_measurement = None
+    _status_fields = frozenset({STATUS_FIELD_AUTO_DETECTION})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the audio threshold number."""
@@ -80,6 +76,8 @@ class MusicCastAudioThresholdNumber(MusicCastNumberBase):
     @property
     def native_value(self) -> Optional[float]:
         """Return the current audio threshold."""
+        if self.restoring:
+            return super().native_value
         if not self.coordinator.last_update_success:
             return None
         
@@ -102,6 +100,7 @@ class MusicCastSilenceTimeoutNumber(MusicCastNumberBase):
     _attr_native_max_value = SILENCE_TIMEOUT_MAX
     _attr_native_step = 0.5
     _attr_native_unit_of_measurement = "s"
+    _status_fields = frozenset({STATUS_FIELD_AUTO_DETECTION})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the silence timeout number."""
@@ -111,6 +110,8 @@ class MusicCastSilenceTimeoutNumber(MusicCastNumberBase):
     @property
     def native_value(self) -> Optional[float]:
         """Return the current silence timeout."""
+        if self.restoring:
+            return super().native_value
         if not self.coordinator.last_update_success:
             return None
         
@@ -0,0 +1,68 @@
+"""Opt-in profiler for MusicCast integration."""
+
+import time
+from typing import Any, Dict, Tuple
+
+from homeassistant.util import dt as dt_util
+
+
+class _Timing:
+    """Aggregated timings of one profiled section."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class MusicCastProfiler:
+    """Aggregate timings of coordinator phases and entity properties.
+
+    A profiler only exists while profiling is enabled, so callers check for
+    it before timing anything and pay nothing when it is off.
+    """
+
+    def __init__(self, duration: float) -> None:
+        """Initialize the profiler for a window of `duration` seconds."""
+        self.duration = duration
+        self.started = dt_util.utcnow()
+        self._start = time.monotonic()
+        self._end: float = 0.0
+        self._timings: Dict[Tuple[str, str], _Timing] = {}
+
+    def record(self, section: str, name: str, seconds: float) -> None:
+        """Record one timing sample."""
+        key = (section, name)
+        if (timing := self._timings.get(key)) is None:
+            timing = self._timings[key] = _Timing()
+        timing.count += 1
+        timing.total += seconds
+        if seconds > timing.max:
+            timing.max = seconds
+
+    def stop(self) -> None:
+        """Mark the end of the profiling window."""
+        self._end = time.monotonic()
+
+    def report(self) -> Dict[str, Any]:
+        """Return the aggregated timings, slowest sections first."""
+        sections: Dict[str, Dict[str, Any]] = {}
+        for (section, name), timing in sorted(
+            self._timings.items(), key=lambda item: item[1].total, reverse=True
+        ):
+            sections.setdefault(section, {})[name] = {
+                "count": timing.count,
+                "total_ms": round(timing.total * 1000, 3),
+                "mean_ms": round(timing.total / timing.count * 1000, 4),
+                "max_ms": round(timing.max * 1000, 4),
+            }
+
+        return {
+            "started": self.started.isoformat(),
+            "duration": self.duration,
+            "elapsed": round((self._end or time.monotonic()) - self._start, 3),
+            "running": not self._end,
+            "sections": sections,
+        }
@@ -0,0 +1,68 @@
+"""Command rate limiting for MusicCast integration."""
+
+import time
+from typing import Optional
+
+from .const import (
+    COMMAND_CLASS_DEVICE,
+    COMMAND_CLASS_SETTINGS,
+    COMMAND_CLASS_STREAMING,
+    COMMAND_CLASS_VOLUME,
+    RATE_LIMIT_BURST,
+)
+
+
+def command_class(endpoint: str) -> str:
+    """Return the rate limit class of a command endpoint."""
+    if endpoint.startswith(("/volume/", "/mute", "/unmute")):
+        return COMMAND_CLASS_VOLUME
+    if endpoint.startswith(("/auto-detection/threshold/", "/auto-detection/silence-timeout/")):
+        return COMMAND_CLASS_SETTINGS
+    if endpoint.startswith(("/audio-devices/", "/cast-devices/")):
+        return COMMAND_CLASS_DEVICE
+    return COMMAND_CLASS_STREAMING
+
+
+def coalesce_key(endpoint: str) -> Optional[str]:
+    """Return the setting a command overwrites, or None.
+
+    Commands that overwrite a setting can be deferred when rate limited,
+    keeping only the latest value. Other commands are rejected.
+    """
+    if endpoint in ("/mute", "/unmute"):
+        return "/mute"
+    for prefix in ("/volume/", "/auto-detection/threshold/", "/auto-detection/silence-timeout/"):
+        if endpoint.startswith(prefix):
+            return prefix
+    return None
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` commands per minute with a small burst."""
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated")
+
+    def __init__(self, rate: float, capacity: float = RATE_LIMIT_BURST) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate / 60
+        self.capacity = min(capacity, max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def delay(self) -> float:
+        """Return the seconds until a token is available."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self.rate)
\ No newline at end of file
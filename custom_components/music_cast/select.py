@@ -5,13 +5,13 @@ from typing import Optional
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, STATUS_FIELD_CAST_DEVICE
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,29 +30,23 @@ async def async_setup_entry(
     ])
 
 
-class MusicCastSelectBase(CoordinatorEntity, SelectEntity):
+class MusicCastSelectBase(MusicCastEntity, SelectEntity):
     """Base class for MusicCast select entities."""
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
+    _profiled_properties = ("state", "extra_state_attributes", "options")
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the select entity."""
         super().__init__(coordinator)
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore the selected option, the only one known until the first refresh."""
+        self._attr_current_option = last_state.state
+        self._attr_options = [last_state.state]
 
 
 class MusicCastAudioDeviceSelect(MusicCastSelectBase):
@@ -60,6 +54,7 @@ class MusicCastAudioDeviceSelect(MusicCastSelectBase):
 
     _attr_name = "Audio Input Device"
     _attr_icon = "mdi:microphone"
+    _data_sections = frozenset({"audio_devices"})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the audio device select."""
@@ -69,6 +64,8 @@ class MusicCastAudioDeviceSelect(MusicCastSelectBase):
     @property
     def options(self) -> list[str]:
         """Return available audio devices."""
+        if self.restoring:
+            return super().options
         audio_devices = self.coordinator.data.get("audio_devices", {})
         devices = audio_devices.get("devices", [])
         
@@ -82,6 +79,8 @@ class MusicCastAudioDeviceSelect(MusicCastSelectBase):
     @property
     def current_option(self) -> Optional[str]:
         """Return current audio device."""
+        if self.restoring:
+            return super().current_option
         audio_devices = self.coordinator.data.get("audio_devices", {})
         current_device_index = audio_devices.get("current_device")
         
@@ -117,28 +116,39 @@ class MusicCastCastDeviceSelect(MusicCastSelectBase):
 
     _attr_name = "Cast Device"
     _attr_icon = "mdi:cast"
+    _status_fields = frozenset({STATUS_FIELD_CAST_DEVICE})
+    _data_sections = frozenset({"cast_devices"})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the cast device select."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_cast_device_select"
+        self._options: list[str] = ["None"]
+        self._options_version = 0
 
     @property
     def options(self) -> list[str]:
-        """Return available cast devices."""
-        cast_devices = self.coordinator.data.get("cast_devices", {})
-        devices = cast_devices.get("devices", [])
-        
-        options = ["None"]  # Option to disconnect
-        for device in devices:
-            device_name = device.get("name", "Unknown Device")
-            options.append(device_name)
-        
-        return options
+        """Return available cast devices.
+
+        The list is only rebuilt when the coordinator's inventory changes.
+        """
+        if self.restoring:
+            return super().options
+        version = self.coordinator.cast_inventory_version
+        if version != self._options_version:
+            self._options = ["None"] + [  # "None" disconnects
+                device.name or "Unknown Device"
+                for device in self.coordinator.cast_devices_by_uuid.values()
+            ]
+            self._options_version = version
+
+        return self._options
 
     @property
     def current_option(self) -> str:
         """Return current cast device."""
+        if self.restoring:
+            return super().current_option
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         
@@ -155,14 +165,11 @@ class MusicCastCastDeviceSelect(MusicCastSelectBase):
             await self.coordinator.async_request_refresh()
             return
         
-        cast_devices = self.coordinator.data.get("cast_devices", {})
-        devices = cast_devices.get("devices", [])
-        
         # Find device UUID by name
         device_uuid = None
-        for device in devices:
-            if device.get("name") == option:
-                device_uuid = device.get("uuid")
+        for uuid, device in self.coordinator.cast_devices_by_uuid.items():
+            if device.name == option:
+                device_uuid = uuid
                 break
         
         if device_uuid:
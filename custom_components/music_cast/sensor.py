@@ -1,17 +1,31 @@
 """Sensor entities for MusicCast integration."""
 
 import logging
+import time
+from datetime import datetime
 from typing import Any, Optional
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    HEALTH_SENSOR_MIN_WRITE_INTERVAL,
+    STATUS_FIELD_AUDIO_SERVER,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_STREAMING,
+)
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,10 +43,14 @@ async def async_setup_entry(
         MusicCastAudioDeviceSensor(coordinator, entry),
         MusicCastCastDeviceSensor(coordinator, entry),
         MusicCastConnectedClientsSensor(coordinator, entry),
+        MusicCastLatencySensor(coordinator, entry),
+        MusicCastLatencyP95Sensor(coordinator, entry),
+        MusicCastErrorRateSensor(coordinator, entry),
+        MusicCastLastUpdateSensor(coordinator, entry),
     ])
 
 
-class MusicCastSensorBase(CoordinatorEntity, SensorEntity):
+class MusicCastSensorBase(MusicCastEntity, RestoreSensor):
     """Base class for MusicCast sensors."""
 
     _attr_has_entity_name = True
@@ -42,19 +60,12 @@ class MusicCastSensorBase(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore the native value, typed as it was stored."""
+        if (sensor_data := await self.async_get_last_sensor_data()) is not None:
+            self._attr_native_value = sensor_data.native_value
 
 
 class MusicCastStatusSensor(MusicCastSensorBase):
@@ -62,6 +73,11 @@ class MusicCastStatusSensor(MusicCastSensorBase):
 
     _attr_name = "Status"
     _attr_icon = "mdi:information"
+    _status_fields = frozenset({
+        STATUS_FIELD_STREAMING,
+        STATUS_FIELD_AUTO_DETECTION,
+        STATUS_FIELD_CAST_DEVICE,
+    })
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the status sensor."""
@@ -71,6 +87,8 @@ class MusicCastStatusSensor(MusicCastSensorBase):
     @property
     def native_value(self) -> Optional[str]:
         """Return the status."""
+        if self.restoring:
+            return super().native_value
         if not self.coordinator.last_update_success:
             return "Unavailable"
         
@@ -92,6 +110,8 @@ class MusicCastStatusSensor(MusicCastSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         status = self.coordinator.data.get("status", {})
         
         return {
@@ -106,6 +126,7 @@ class MusicCastAudioDeviceSensor(MusicCastSensorBase):
     """Sensor showing current audio input device."""
 
     _attr_name = "Audio Input Device"
+    _data_sections = frozenset({"audio_devices"})
     _attr_icon = "mdi:microphone"
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
@@ -116,6 +137,8 @@ class MusicCastAudioDeviceSensor(MusicCastSensorBase):
     @property
     def native_value(self) -> Optional[str]:
         """Return the current audio device name."""
+        if self.restoring:
+            return super().native_value
         audio_devices = self.coordinator.data.get("audio_devices", {})
         current_device_index = audio_devices.get("current_device")
         
@@ -132,6 +155,8 @@ class MusicCastAudioDeviceSensor(MusicCastSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         audio_devices = self.coordinator.data.get("audio_devices", {})
         current_device_index = audio_devices.get("current_device")
         
@@ -157,7 +182,9 @@ class MusicCastCastDeviceSensor(MusicCastSensorBase):
     """Sensor showing current cast device."""
 
     _attr_name = "Cast Device"
+    _data_sections = frozenset({"cast_devices"})
     _attr_icon = "mdi:cast"
+    _status_fields = frozenset({STATUS_FIELD_CAST_DEVICE})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the cast device sensor."""
@@ -167,6 +194,8 @@ class MusicCastCastDeviceSensor(MusicCastSensorBase):
     @property
     def native_value(self) -> Optional[str]:
         """Return the current cast device name."""
+        if self.restoring:
+            return super().native_value
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         
@@ -178,13 +207,15 @@ class MusicCastCastDeviceSensor(MusicCastSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         status = self.coordinator.data.get("status", {})
         cast_device = status.get("cast_device", {})
         cast_devices = self.coordinator.data.get("cast_devices", {})
         
         attrs = {
             "connected": cast_device.get("connected", False),
-            "available_devices": len(cast_devices.get("devices", [])),
+            "available_devices": len(cast_devices),
         }
         
         if cast_device.get("connected", False):
@@ -205,6 +236,7 @@ class MusicCastConnectedClientsSensor(MusicCastSensorBase):
     _attr_icon = "mdi:account-multiple"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "clients"
+    _status_fields = frozenset({STATUS_FIELD_AUDIO_SERVER})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the connected clients sensor."""
@@ -214,6 +246,8 @@ class MusicCastConnectedClientsSensor(MusicCastSensorBase):
     @property
     def native_value(self) -> Optional[int]:
         """Return the number of connected clients."""
+        if self.restoring:
+            return super().native_value
         status = self.coordinator.data.get("status", {})
         audio_server = status.get("audio_server", {})
         return audio_server.get("clients_connected", 0)
@@ -221,10 +255,130 @@ class MusicCastConnectedClientsSensor(MusicCastSensorBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         status = self.coordinator.data.get("status", {})
         audio_server = status.get("audio_server", {})
         
         return {
             "recording": audio_server.get("recording", False),
             "server_port": audio_server.get("port"),
-        }
\ No newline at end of file
+        }
+
+
+class MusicCastHealthSensorBase(MusicCastSensorBase):
+    """Base class for sensors reporting the health of the server connection.
+
+    Values come from the coordinator's refresh history rather than from the
+    server, so these sensors stay available while the server is down. State
+    writes are throttled because the values change on every refresh.
+    """
+
+    def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the health sensor."""
+        super().__init__(coordinator, entry)
+        self._last_write: float = 0.0
+        self._last_update_success: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state at most once per interval, or when the server fails or recovers."""
+        now = time.monotonic()
+        success = self.coordinator.last_update_success
+        if (
+            success == self._last_update_success
+            and now - self._last_write < HEALTH_SENSOR_MIN_WRITE_INTERVAL
+        ):
+            return
+
+        self._last_write = now
+        self._last_update_success = success
+        self._async_schedule_write()
+
+
+class MusicCastLatencySensor(MusicCastHealthSensorBase):
+    """Sensor showing the rolling mean round-trip latency of refreshes."""
+
+    _attr_name = "Latency"
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_latency"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the mean latency in milliseconds."""
+        latency = self.coordinator.stats.history.mean_latency
+        return latency * 1000 if latency is not None else None
+
+
+class MusicCastLatencyP95Sensor(MusicCastHealthSensorBase):
+    """Sensor showing the rolling 95th percentile latency of refreshes."""
+
+    _attr_name = "Latency P95"
+    _attr_icon = "mdi:timer-alert-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the p95 latency sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_latency_p95"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the 95th percentile latency in milliseconds."""
+        latency = self.coordinator.stats.history.p95_latency
+        return latency * 1000 if latency is not None else None
+
+
+class MusicCastErrorRateSensor(MusicCastHealthSensorBase):
+    """Sensor showing the share of recent refreshes that failed."""
+
+    _attr_name = "Error Rate"
+    _attr_icon = "mdi:alert-circle-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the error rate sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_error_rate"
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the error rate in percent."""
+        error_rate = self.coordinator.stats.history.error_rate
+        return error_rate * 100 if error_rate is not None else None
+
+
+class MusicCastLastUpdateSensor(MusicCastHealthSensorBase):
+    """Sensor showing when the server last answered a refresh."""
+
+    _attr_name = "Last Successful Update"
+    _attr_icon = "mdi:clock-check-outline"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the last update sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_last_successful_update"
+
+    @property
+    def native_value(self) -> Optional[datetime]:
+        """Return the time of the last successful refresh."""
+        return self.coordinator.stats.history.last_success_time
\ No newline at end of file
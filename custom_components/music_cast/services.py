@@ -0,0 +1,226 @@
+"""Services for MusicCast integration."""
+
+import logging
+import time
+from typing import Any, Dict
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    ATTR_CAST_CONNECTED,
+    ATTR_CAST_DEVICE_UUID,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_SCENE,
+    ATTR_STREAMING,
+    ATTR_TIMEOUT,
+    CALIBRATION_DURATION_MAX,
+    CALIBRATION_DURATION_MIN,
+    DEFAULT_CALIBRATION_DURATION,
+    DEFAULT_PROFILING_DURATION,
+    DEFAULT_SCENE,
+    DEFAULT_WAIT_FOR_STATE_TIMEOUT,
+    DOMAIN,
+    PROFILING_DURATION_MAX,
+    SERVICE_CALIBRATE_THRESHOLD,
+    SERVICE_RESTORE,
+    SERVICE_SNAPSHOT,
+    SERVICE_START_PROFILING,
+    SERVICE_WAIT_FOR_STATE,
+    WAIT_FOR_STATE_TIMEOUT_MAX,
+)
+from .coordinator import MusicCastCoordinator, StateCondition, current_cast_device_uuid
+
+_LOGGER = logging.getLogger(__name__)
+
+WAIT_FOR_STATE_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_STREAMING): cv.boolean,
+        vol.Optional(ATTR_CAST_CONNECTED): cv.boolean,
+        vol.Optional(ATTR_CAST_DEVICE_UUID): cv.string,
+        vol.Optional(ATTR_TIMEOUT, default=DEFAULT_WAIT_FOR_STATE_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=WAIT_FOR_STATE_TIMEOUT_MAX)
+        ),
+    }),
+    cv.has_at_least_one_key(ATTR_STREAMING, ATTR_CAST_CONNECTED, ATTR_CAST_DEVICE_UUID),
+)
+
+START_PROFILING_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILING_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=1, max=PROFILING_DURATION_MAX)
+    ),
+})
+
+CALIBRATE_THRESHOLD_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_DURATION, default=DEFAULT_CALIBRATION_DURATION): vol.All(
+        vol.Coerce(float), vol.Range(min=CALIBRATION_DURATION_MIN, max=CALIBRATION_DURATION_MAX)
+    ),
+})
+
+SCENE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_SCENE, default=DEFAULT_SCENE): cv.string,
+})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MusicCast services."""
+
+    async def async_wait_for_state(call: ServiceCall) -> ServiceResponse:
+        """Wait until a MusicCast server reaches the requested state."""
+        coordinator = _async_get_coordinator(hass, call)
+        condition = _build_state_condition(call.data)
+
+        start = time.monotonic()
+        matched = await coordinator.async_wait_for_state(condition, call.data[ATTR_TIMEOUT])
+
+        data = coordinator.data or {}
+        status = data.get("status", {})
+        # Fields not fetched yet are reported as None
+        return {
+            "matched": matched,
+            "elapsed": round(time.monotonic() - start, 3),
+            ATTR_STREAMING: status.get("streaming"),
+            ATTR_CAST_CONNECTED: status.get("cast_device", {}).get("connected"),
+            ATTR_CAST_DEVICE_UUID: current_cast_device_uuid(data),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_WAIT_FOR_STATE,
+        async_wait_for_state,
+        schema=WAIT_FOR_STATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_start_profiling(call: ServiceCall) -> None:
+        """Profile a MusicCast server for a bounded window."""
+        coordinator = _async_get_coordinator(hass, call)
+        coordinator.async_start_profiling(call.data[ATTR_DURATION])
+        _LOGGER.info(
+            "Profiling MusicCast server for %s seconds, download diagnostics for the report",
+            call.data[ATTR_DURATION],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROFILING,
+        async_start_profiling,
+        schema=START_PROFILING_SCHEMA,
+    )
+
+    async def async_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Save the current setup of a MusicCast server as a scene."""
+        coordinator = _async_get_coordinator(hass, call)
+        scene = await coordinator.async_snapshot_scene(call.data[ATTR_SCENE])
+        return scene.as_dict()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        async_snapshot,
+        schema=SCENE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_restore(call: ServiceCall) -> None:
+        """Restore a scene saved by the snapshot service."""
+        coordinator = _async_get_coordinator(hass, call)
+        if (scene := coordinator.scenes.get(call.data[ATTR_SCENE])) is None:
+            raise HomeAssistantError(f"No MusicCast scene named {call.data[ATTR_SCENE]}")
+
+        if not await coordinator.async_restore_scene(scene):
+            raise HomeAssistantError(
+                f"MusicCast scene {call.data[ATTR_SCENE]} was only partially restored"
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        async_restore,
+        schema=SCENE_SCHEMA,
+    )
+
+    async def async_calibrate_threshold(call: ServiceCall) -> ServiceResponse:
+        """Set the audio threshold and silence timeout from sampled input levels."""
+        coordinator = _async_get_coordinator(hass, call)
+        try:
+            calibration = await coordinator.async_calibrate_threshold(call.data[ATTR_DURATION])
+        except UpdateFailed as ex:
+            raise HomeAssistantError(f"MusicCast threshold calibration failed: {ex}") from ex
+
+        _LOGGER.info(
+            "Calibrated MusicCast audio threshold to %s and silence timeout to %s",
+            calibration.threshold, calibration.silence_timeout,
+        )
+        return calibration.as_dict()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CALIBRATE_THRESHOLD,
+        async_calibrate_threshold,
+        schema=CALIBRATE_THRESHOLD_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+@callback
+def _async_get_coordinator(hass: HomeAssistant, call: ServiceCall) -> MusicCastCoordinator:
+    """Return the coordinator targeted by a service call."""
+    coordinators: Dict[str, MusicCastCoordinator] = hass.data.get(DOMAIN, {})
+
+    if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+        if entry_id not in coordinators:
+            raise HomeAssistantError(f"MusicCast config entry {entry_id} is not loaded")
+        return coordinators[entry_id]
+
+    if len(coordinators) != 1:
+        raise HomeAssistantError(
+            "A config_entry_id is required when more than one MusicCast server is configured"
+        )
+
+    return next(iter(coordinators.values()))
+
+
+def _build_state_condition(data: Dict[str, Any]) -> StateCondition:
+    """Build a condition on coordinator data from wait_for_state fields."""
+    streaming = data.get(ATTR_STREAMING)
+    cast_connected = data.get(ATTR_CAST_CONNECTED)
+    cast_device_uuid = data.get(ATTR_CAST_DEVICE_UUID)
+
+    def condition(snapshot: Dict[str, Any]) -> bool:
+        # Fields missing from the snapshot were not fetched yet, they are
+        # unknown rather than False and never match
+        status = snapshot.get("status", {})
+        cast_device = status.get("cast_device")
+
+        if streaming is not None and status.get("streaming") != streaming:
+            return False
+
+        if cast_connected is not None and (
+            cast_device is None or cast_device.get("connected") != cast_connected
+        ):
+            return False
+
+        if cast_device_uuid is not None and (
+            cast_device is None or current_cast_device_uuid(snapshot) != cast_device_uuid
+        ):
+            return False
+
+        return True
+
+    return condition
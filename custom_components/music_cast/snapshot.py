@@ -0,0 +1,68 @@
+"""Scene snapshots for MusicCast integration.
+
+Not named scene.py, which Home Assistant would treat as a scene platform.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .const import STATUS_FIELD_AUTO_DETECTION, STATUS_FIELD_CAST_DEVICE
+
+# Status fields a scene is captured from
+SCENE_STATUS_FIELDS = frozenset({STATUS_FIELD_AUTO_DETECTION, STATUS_FIELD_CAST_DEVICE})
+
+# Volume levels closer than this are treated as equal
+VOLUME_TOLERANCE = 0.005
+
+
+@dataclass(frozen=True, slots=True)
+class MusicCastScene:
+    """Restorable setup of a MusicCast server.
+
+    Fields are None when the server did not report them, and are then left
+    alone on restore.
+    """
+
+    audio_device: Optional[Tuple[Optional[str], Optional[int], Optional[int]]] = None
+    cast_device_uuid: Optional[str] = None
+    volume_level: Optional[float] = None
+    is_muted: Optional[bool] = None
+    threshold: Optional[float] = None
+    silence_timeout: Optional[float] = None
+    auto_detection_enabled: Optional[bool] = None
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], cast_device_uuid: Optional[str]) -> "MusicCastScene":
+        """Capture a scene from a coordinator snapshot."""
+        status = data.get("status", {})
+        auto_detection = status.get("auto_detection", {})
+        cast_device = status.get("cast_device", {})
+        audio_devices = data.get("audio_devices", {})
+
+        audio_device = None
+        for device in audio_devices.get("devices", []):
+            if device.get("index") == audio_devices.get("current_device"):
+                audio_device = (device.get("name"), device.get("channels"), device.get("sample_rate"))
+                break
+
+        return cls(
+            audio_device=audio_device,
+            cast_device_uuid=cast_device_uuid,
+            volume_level=cast_device.get("volume_level") if cast_device_uuid else None,
+            is_muted=cast_device.get("is_muted") if cast_device_uuid else None,
+            threshold=auto_detection.get("threshold"),
+            silence_timeout=auto_detection.get("silence_timeout"),
+            auto_detection_enabled=auto_detection.get("enabled"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the scene as a service response."""
+        scene = asdict(self)
+        if self.audio_device is not None:
+            name, channels, sample_rate = self.audio_device
+            scene["audio_device"] = {
+                "name": name,
+                "channels": channels,
+                "sample_rate": sample_rate,
+            }
+        return scene
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""Runtime statistics for MusicCast integration."""
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from homeassistant.util import dt as dt_util
+
+from .const import HEALTH_WINDOW_SIZE
+
+# Path segments carrying values (volume levels, indexes, UUIDs) are folded
+# so that counters are kept per endpoint rather than per request
+_VALUE_SEGMENT = re.compile(r"/[^/]*\d[^/]*")
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Return the counter key for an endpoint path."""
+    return _VALUE_SEGMENT.sub("/{}", endpoint.split("?", 1)[0])
+
+
+class RefreshHistory:
+    """Ring buffer of the latency and outcome of recent refreshes."""
+
+    __slots__ = ("_latencies", "_failures", "last_success_time")
+
+    def __init__(self, size: int = HEALTH_WINDOW_SIZE) -> None:
+        """Initialize the history."""
+        self._latencies: deque = deque(maxlen=size)
+        self._failures: deque = deque(maxlen=size)
+        self.last_success_time: Optional[datetime] = None
+
+    def record(self, latency: float, success: bool) -> None:
+        """Record a finished refresh."""
+        self._failures.append(not success)
+        if success:
+            self._latencies.append(latency)
+            self.last_success_time = dt_util.utcnow()
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        """Return the mean latency of recent successful refreshes, in seconds."""
+        if not self._latencies:
+            return None
+        return sum(self._latencies) / len(self._latencies)
+
+    @property
+    def p95_latency(self) -> Optional[float]:
+        """Return the 95th percentile latency of recent successful refreshes."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        return latencies[round(0.95 * (len(latencies) - 1))]
+
+    @property
+    def error_rate(self) -> Optional[float]:
+        """Return the fraction of recent refreshes that failed."""
+        if not self._failures:
+            return None
+        return sum(self._failures) / len(self._failures)
+
+
+class WireFormatStats:
+    """Totals of the responses received in one wire format."""
+
+    __slots__ = ("responses", "wire_bytes", "decoded_bytes", "decode_time")
+
+    def __init__(self) -> None:
+        """Initialize the totals."""
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.decode_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the totals as a JSON serializable dict."""
+        return {
+            "responses": self.responses,
+            "wire_bytes": self.wire_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "compression_ratio": round(
+                self.wire_bytes / self.decoded_bytes, 4
+            ) if self.decoded_bytes else None,
+            "mean_decode_ms": round(self.decode_time / self.responses * 1000, 4),
+        }
+
+
+@dataclass
+class MusicCastStats:
+    """Counters updated by the coordinator on its hot paths."""
+
+    refresh_count: int = 0
+    refresh_failures: int = 0
+    last_refresh_duration: float = 0.0
+    total_refresh_duration: float = 0.0
+    requests: Counter = field(default_factory=Counter)
+    request_errors: Counter = field(default_factory=Counter)
+    # Bytes on the wire, before decompression
+    bytes_received: int = 0
+    formats: Dict[str, WireFormatStats] = field(default_factory=dict)
+    entity_state_writes: int = 0
+    # Updates that did not change the data an entity reads
+    entity_writes_skipped: int = 0
+    commands_issued: int = 0
+    commands_coalesced: int = 0
+    # Commands held back by rate limiting: rejected ones per command class,
+    # and deferred ones of which only the latest value is sent
+    commands_rejected: Counter = field(default_factory=Counter)
+    commands_deferred: int = 0
+    failovers: int = 0
+    # Stalled streams detected by the watchdog and its recovery attempts
+    stream_stalls: int = 0
+    stream_recovery_attempts: int = 0
+    stream_recoveries: int = 0
+    stream_recovery_failures: int = 0
+    # Time spent decoding the last response of each endpoint, in seconds
+    decode_times: Dict[str, float] = field(default_factory=dict)
+    last_error: Optional[str] = None
+    last_error_time: Optional[datetime] = None
+    history: RefreshHistory = field(default_factory=RefreshHistory)
+
+    def record_refresh(self, duration: float, error: Optional[str] = None) -> None:
+        """Record a finished refresh, and its error if it failed."""
+        self.refresh_count += 1
+        self.last_refresh_duration = duration
+        self.total_refresh_duration += duration
+        self.history.record(duration, error is None)
+        if error is not None:
+            self.refresh_failures += 1
+            self.last_error = error
+            self.last_error_time = dt_util.utcnow()
+
+    def record_request(self, endpoint: str) -> None:
+        """Record a request to an endpoint."""
+        self.requests[endpoint_key(endpoint)] += 1
+
+    def record_response(
+        self, wire_format: str, wire_bytes: int, decoded_bytes: int, decode_time: float
+    ) -> None:
+        """Record the size and decode time of a response in a wire format."""
+        if (totals := self.formats.get(wire_format)) is None:
+            totals = self.formats[wire_format] = WireFormatStats()
+        totals.responses += 1
+        totals.wire_bytes += wire_bytes
+        totals.decoded_bytes += decoded_bytes
+        totals.decode_time += decode_time
+
+    def record_error(self, endpoint: str, error: str) -> None:
+        """Record a failed request to an endpoint."""
+        self.request_errors[endpoint_key(endpoint)] += 1
+        self.last_error = f"{endpoint}: {error}"
+        self.last_error_time = dt_util.utcnow()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a JSON serializable dict."""
+        return {
+            "refresh_count": self.refresh_count,
+            "refresh_failures": self.refresh_failures,
+            "last_refresh_duration": round(self.last_refresh_duration, 4),
+            "mean_refresh_duration": round(
+                self.total_refresh_duration / self.refresh_count, 4
+            ) if self.refresh_count else None,
+            "requests": dict(self.requests),
+            "request_errors": dict(self.request_errors),
+            "bytes_received": self.bytes_received,
+            "formats": {name: totals.as_dict() for name, totals in self.formats.items()},
+            "entity_state_writes": self.entity_state_writes,
+            "entity_writes_skipped": self.entity_writes_skipped,
+            "commands_issued": self.commands_issued,
+            "commands_coalesced": self.commands_coalesced,
+            "commands_rejected": dict(self.commands_rejected),
+            "commands_deferred": self.commands_deferred,
+            "failovers": self.failovers,
+            "stream_stalls": self.stream_stalls,
+            "stream_recovery_attempts": self.stream_recovery_attempts,
+            "stream_recoveries": self.stream_recoveries,
+            "stream_recovery_failures": self.stream_recovery_failures,
+            "decode_times": {
+                endpoint: round(seconds, 6) for endpoint, seconds in self.decode_times.items()
+            },
+            "last_error": self.last_error,
+            "last_error_time": self.last_error_time.isoformat() if self.last_error_time else None,
+            "mean_latency": self.history.mean_latency,
+            "p95_latency": self.history.p95_latency,
+            "error_rate": self.history.error_rate,
+        }
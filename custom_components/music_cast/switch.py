@@ -1,20 +1,30 @@
 """Switch entities for MusicCast integration."""
 
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_STREAMING,
+)
 from .coordinator import MusicCastCoordinator
+from .entity import MusicCastEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cast target switches are named after their cast device with this prefix
+CAST_TARGET_NAME_PREFIX = "Cast to "
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,8 +39,88 @@ async def async_setup_entry(
         MusicCastStreamingSwitch(coordinator, entry),
     ])
 
+    _async_setup_cast_target_switches(hass, entry, coordinator, async_add_entities)
+
+
+def _cast_target_device_name(original_name: Optional[str]) -> Optional[str]:
+    """Return the cast device name from the registered name of a cast target switch.
+
+    Every prefix is removed, including the repeated ones earlier versions
+    registered.
+    """
+    name = original_name
+    while name and name.startswith(CAST_TARGET_NAME_PREFIX):
+        name = name[len(CAST_TARGET_NAME_PREFIX):]
+    return name or None
+
+
+@callback
+def _async_setup_cast_target_switches(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: MusicCastCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Keep one cast target switch per cast device in the inventory."""
+    registry = er.async_get(hass)
+    unique_id_prefix = f"{entry.entry_id}_cast_target_"
+    switches: Dict[str, MusicCastCastTargetSwitch] = {}
+
+    # Recreate switches known from a previous run so they restore their
+    # state before the first inventory arrives
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (
+            registry_entry.domain == "switch"
+            and registry_entry.unique_id.startswith(unique_id_prefix)
+        ):
+            uuid = registry_entry.unique_id[len(unique_id_prefix):]
+            switches[uuid] = MusicCastCastTargetSwitch(
+                coordinator,
+                unique_id_prefix,
+                uuid,
+                _cast_target_device_name(registry_entry.original_name),
+            )
+
+    if switches:
+        async_add_entities(list(switches.values()))
 
-class MusicCastSwitchBase(CoordinatorEntity, SwitchEntity):
+    inventory_version: Optional[int] = None
+
+    @callback
+    def _async_sync_switches() -> None:
+        """Add and remove switches after the inventory changed."""
+        nonlocal inventory_version
+        if (
+            not coordinator.cast_inventory_loaded
+            or coordinator.cast_inventory_version == inventory_version
+        ):
+            return
+        inventory_version = coordinator.cast_inventory_version
+
+        devices = coordinator.cast_devices_by_uuid
+        new_switches = [
+            MusicCastCastTargetSwitch(coordinator, unique_id_prefix, uuid, device.name)
+            for uuid, device in devices.items()
+            if uuid not in switches
+        ]
+        for switch in new_switches:
+            switches[switch.uuid] = switch
+        if new_switches:
+            async_add_entities(new_switches)
+
+        for uuid in [uuid for uuid in switches if uuid not in devices]:
+            switch = switches.pop(uuid)
+            # Looked up by unique ID, disabled switches are never added and
+            # have no entity ID. Removing the registry entry also removes
+            # the entity.
+            if entity_id := registry.async_get_entity_id("switch", DOMAIN, switch.unique_id):
+                registry.async_remove(entity_id)
+
+    _async_sync_switches()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_switches))
+
+
+class MusicCastSwitchBase(MusicCastEntity, SwitchEntity):
     """Base class for MusicCast switches."""
 
     _attr_has_entity_name = True
@@ -40,19 +130,11 @@ class MusicCastSwitchBase(CoordinatorEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator)
         
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"MusicCast ({coordinator.host})",
-            manufacturer="MusicCast",
-            model="Audio Cast Server",
-            sw_version="1.0.0",
-            configuration_url=coordinator.base_url,
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore whether the switch was on."""
+        self._attr_is_on = last_state.state == STATE_ON
 
 
 class MusicCastAutoDetectionSwitch(MusicCastSwitchBase):
@@ -60,6 +142,7 @@ class MusicCastAutoDetectionSwitch(MusicCastSwitchBase):
 
     _attr_name = "Auto Detection"
     _attr_icon = "mdi:auto-mode"
+    _status_fields = frozenset({STATUS_FIELD_AUTO_DETECTION})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the auto detection switch."""
@@ -69,6 +152,8 @@ class MusicCastAutoDetectionSwitch(MusicCastSwitchBase):
     @property
     def is_on(self) -> Optional[bool]:
         """Return true if auto detection is enabled."""
+        if self.restoring:
+            return super().is_on
         if not self.coordinator.last_update_success:
             return None
         
@@ -79,6 +164,8 @@ class MusicCastAutoDetectionSwitch(MusicCastSwitchBase):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        if self.restoring:
+            return super().extra_state_attributes
         status = self.coordinator.data.get("status", {})
         auto_detection = status.get("auto_detection", {})
         
@@ -104,6 +191,7 @@ class MusicCastStreamingSwitch(MusicCastSwitchBase):
 
     _attr_name = "Manual Streaming"
     _attr_icon = "mdi:cast-audio"
+    _status_fields = frozenset({STATUS_FIELD_STREAMING, STATUS_FIELD_AUTO_DETECTION})
 
     def __init__(self, coordinator: MusicCastCoordinator, entry: ConfigEntry) -> None:
         """Initialize the streaming switch."""
@@ -113,6 +201,8 @@ class MusicCastStreamingSwitch(MusicCastSwitchBase):
     @property
     def is_on(self) -> Optional[bool]:
         """Return true if streaming is active."""
+        if self.restoring:
+            return super().is_on
         if not self.coordinator.last_update_success:
             return None
         
@@ -138,4 +228,71 @@ class MusicCastStreamingSwitch(MusicCastSwitchBase):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Stop streaming."""
         await self.coordinator.async_stop_streaming()
+        await self.coordinator.async_request_refresh()
+
+
+class MusicCastCastTargetSwitch(MusicCastEntity, SwitchEntity):
+    """Switch that casts to one cast device of the inventory.
+
+    One of these exists per cast device, so construction is kept to a few
+    attribute assignments.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:cast-variant"
+    _status_fields = frozenset({STATUS_FIELD_CAST_DEVICE})
+    _data_sections = frozenset({"cast_devices"})
+
+    def __init__(
+        self,
+        coordinator: MusicCastCoordinator,
+        unique_id_prefix: str,
+        uuid: str,
+        name: Optional[str],
+    ) -> None:
+        """Initialize the cast target switch."""
+        super().__init__(coordinator)
+        self.uuid = uuid
+        self._device_name = name
+        self._attr_unique_id = f"{unique_id_prefix}{uuid}"
+        self._attr_device_info = coordinator.device_info
+
+    async def _async_restore_last_state(self, last_state: State) -> None:
+        """Restore whether the cast device was connected."""
+        self._attr_is_on = last_state.state == STATE_ON
+
+    @property
+    def name(self) -> str:
+        """Return the name of the switch, following device renames."""
+        device = self.coordinator.cast_devices_by_uuid.get(self.uuid)
+        if device is not None:
+            self._device_name = device.name
+        return f"{CAST_TARGET_NAME_PREFIX}{self._device_name or self.uuid}"
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return true if this cast device is connected."""
+        if self.restoring:
+            return super().is_on
+        if not self.coordinator.last_update_success:
+            return None
+
+        return self.coordinator.connected_cast_device_uuid == self.uuid
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        return {"uuid": self.uuid}
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Connect to this cast device."""
+        await self.coordinator.async_connect_cast_device(self.uuid)
+        await self.coordinator.async_request_refresh()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disconnect this cast device by stopping auto detection."""
+        if self.coordinator.connected_cast_device_uuid != self.uuid:
+            return
+
+        await self.coordinator.async_stop_auto_detection()
         await self.coordinator.async_request_refresh()
\ No newline at end of file
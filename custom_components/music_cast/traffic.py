@@ -0,0 +1,162 @@
+"""Opt-in traffic recorder for MusicCast integration.
+
+Not named recorder.py, which Home Assistant would treat as a recorder platform.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    TRAFFIC_BACKUPS,
+    TRAFFIC_FLUSH_INTERVAL,
+    TRAFFIC_MAX_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bodies of these types are recorded as text, others base64 encoded
+TEXT_CONTENT_TYPES = frozenset({"application/json", "text/plain"})
+
+
+class MusicCastTrafficRecorder:
+    """Append the requests and responses of a coordinator to a file.
+
+    Every exchange is one compact JSON line. Lines are buffered on the event
+    loop and appended by the executor at most once per flush interval. The
+    file is rotated when it would exceed `max_bytes`, keeping `backups`
+    older files, `.1` being the newest.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_bytes: int = TRAFFIC_MAX_BYTES,
+        backups: int = TRAFFIC_BACKUPS,
+    ) -> None:
+        """Initialize the recorder."""
+        self._hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records = 0
+        self._lines: List[str] = []
+        self._unsub_flush: Optional[CALLBACK_TYPE] = None
+        # Keeps executor writes in order
+        self._write_lock = asyncio.Lock()
+
+    @callback
+    def record(
+        self,
+        method: str,
+        path: str,
+        elapsed: float,
+        *,
+        server: int = 0,
+        params: Optional[Dict[str, str]] = None,
+        status: Optional[int] = None,
+        content_type: Optional[str] = None,
+        encoding: str = "",
+        body: Optional[bytes] = None,
+        request: Optional[Any] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one exchange with a server.
+
+        Servers are identified by their position in the configured servers,
+        0 being the primary, so recordings do not contain hosts. Bodies are
+        recorded as received on the wire, still compressed when the server
+        compressed them.
+        """
+        entry: Dict[str, Any] = {
+            "time": round(time.time(), 3),
+            "server": server,
+            "method": method,
+            "path": path,
+            "elapsed": round(elapsed, 4),
+        }
+        if params:
+            entry["params"] = params
+        if request is not None:
+            entry["request"] = request
+        if status is not None:
+            entry["status"] = status
+        if error is not None:
+            entry["error"] = error
+        if body is not None:
+            entry["content_type"] = content_type
+            if encoding:
+                entry["encoding"] = encoding
+            if not encoding and content_type in TEXT_CONTENT_TYPES:
+                entry["body"] = bytes(body).decode("utf-8", "replace")
+            else:
+                entry["body_base64"] = base64.b64encode(body).decode("ascii")
+
+        self._lines.append(json.dumps(entry, separators=(",", ":")))
+        self.records += 1
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self._hass, TRAFFIC_FLUSH_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Hand the buffered lines to the executor."""
+        self._unsub_flush = None
+        lines, self._lines = self._lines, []
+        if lines:
+            self._hass.async_create_background_task(
+                self._async_write(lines), f"{DOMAIN} traffic recorder {self.path}"
+            )
+
+    async def _async_write(self, lines: List[str]) -> None:
+        """Append lines to the file in the executor."""
+        async with self._write_lock:
+            try:
+                await self._hass.async_add_executor_job(self._write, lines)
+            except OSError as ex:
+                _LOGGER.error("Failed to write MusicCast traffic to %s: %s", self.path, ex)
+
+    async def async_close(self) -> None:
+        """Write the remaining lines and stop recording."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        lines, self._lines = self._lines, []
+        await self._async_write(lines)
+
+    def _write(self, lines: List[str]) -> None:
+        """Append lines, rotating the file first if it would grow too large."""
+        if not lines:
+            return
+        data = "".join(f"{line}\n" for line in lines).encode()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(data) > self.max_bytes:
+            self._rotate()
+
+        with open(self.path, "ab") as file:
+            file.write(data)
+
+    def _rotate(self) -> None:
+        """Shift the backups by one and move the current file to `.1`."""
+        if not self.backups:
+            os.remove(self.path)
+            return
+
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
\ No newline at end of file
@@ -0,0 +1,208 @@
+"""Stream watchdog for MusicCast integration."""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    EVENT_STREAM_RECOVERED,
+    EVENT_STREAM_RECOVERY_FAILED,
+    EVENT_STREAM_STALLED,
+    STATUS_FIELD_AUDIO_SERVER,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_STREAMING,
+    WATCHDOG_BACKOFF_MAX,
+    WATCHDOG_BACKOFF_MIN,
+    WATCHDOG_MAX_ATTEMPTS,
+    WATCHDOG_MIN_SAMPLES,
+    WATCHDOG_RECOVERY_TIMEOUT,
+    WATCHDOG_STALL_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import MusicCastCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status fields the watchdog cross-checks, requested while it is enabled
+WATCHDOG_STATUS_FIELDS = frozenset({
+    STATUS_FIELD_STREAMING,
+    STATUS_FIELD_AUTO_DETECTION,
+    STATUS_FIELD_CAST_DEVICE,
+    STATUS_FIELD_AUDIO_SERVER,
+})
+
+
+def is_stream_stalled(data: Dict[str, Any]) -> bool:
+    """Return whether a snapshot reports streaming without audio flowing.
+
+    The server streams to a connected cast device, but the cast device is
+    not connected to the audio server as a client.
+    """
+    status = data.get("status", {})
+    return (
+        status.get("streaming", False)
+        and status.get("cast_device", {}).get("connected", False)
+        and status.get("audio_server", {}).get("clients_connected") == 0
+    )
+
+
+def is_stream_flowing(data: Dict[str, Any]) -> bool:
+    """Return whether a snapshot reports streaming to a connected client."""
+    status = data.get("status", {})
+    return (
+        status.get("streaming", False)
+        and status.get("audio_server", {}).get("clients_connected", 0) > 0
+    )
+
+
+class MusicCastStreamWatchdog:
+    """Detect stalled streams of a coordinator and recover them.
+
+    Every snapshot the coordinator delivers is checked. A stall is declared
+    once every snapshot for WATCHDOG_STALL_WINDOW seconds, and at least
+    WATCHDOG_MIN_SAMPLES of them, reported a stalled stream. Recovery stops
+    the stream, reconnects the cast device and starts the stream again, up
+    to WATCHDOG_MAX_ATTEMPTS times with exponential backoff. After the last
+    attempt failed, the watchdog waits for the stall to clear by itself.
+    """
+
+    def __init__(self, coordinator: "MusicCastCoordinator") -> None:
+        """Initialize the watchdog."""
+        self._coordinator = coordinator
+        # Monotonic time of the first stalled snapshot, None while flowing
+        self._stall_started: Optional[float] = None
+        self._stall_samples = 0
+        self._recovery_task: Optional[asyncio.Task] = None
+        self._gave_up = False
+
+    @property
+    def suspected(self) -> bool:
+        """Return whether the latest snapshots reported a stalled stream."""
+        return self._stall_started is not None
+
+    @property
+    def recovering(self) -> bool:
+        """Return whether a recovery is in progress."""
+        return self._recovery_task is not None
+
+    @callback
+    def async_check(self, data: Dict[str, Any]) -> None:
+        """Check a new snapshot and start recovery once a stall is confirmed."""
+        if not is_stream_stalled(data):
+            self._stall_started = None
+            self._stall_samples = 0
+            self._gave_up = False
+            return
+
+        now = time.monotonic()
+        if self._stall_started is None:
+            self._stall_started = now
+        self._stall_samples += 1
+
+        if (
+            self._recovery_task is not None
+            or self._gave_up
+            or self._stall_samples < WATCHDOG_MIN_SAMPLES
+            or now - self._stall_started < WATCHDOG_STALL_WINDOW
+        ):
+            return
+
+        coordinator = self._coordinator
+        cast_uuid = coordinator.connected_cast_device_uuid
+        coordinator.stats.stream_stalls += 1
+        _LOGGER.warning(
+            "Stream of %s is stalled: streaming without audio server clients for %.0fs",
+            coordinator.base_url, now - self._stall_started,
+        )
+        coordinator.hass.bus.async_fire(EVENT_STREAM_STALLED, {
+            "config_entry_id": coordinator.entry_id,
+            "cast_device_uuid": cast_uuid,
+            "stalled_for": round(now - self._stall_started, 1),
+        })
+        auto_detection = data.get("status", {}).get("auto_detection", {}).get("running", False)
+        self._recovery_task = coordinator.hass.async_create_background_task(
+            self._async_recover(self._stall_started, cast_uuid, auto_detection),
+            f"{DOMAIN} stream recovery {coordinator.entry_id}",
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel a recovery in progress."""
+        if self._recovery_task is not None:
+            self._recovery_task.cancel()
+            self._recovery_task = None
+
+    async def _async_recover(
+        self, stall_started: float, cast_uuid: Optional[str], auto_detection: bool
+    ) -> None:
+        """Restart the stream until audio server clients reconnect.
+
+        Streams started by auto detection are restarted through it, so it
+        keeps managing them.
+        """
+        coordinator = self._coordinator
+        prefix = "/auto-detection" if auto_detection else "/stream"
+        stages: List[List[str]] = [[f"{prefix}/stop"]]
+        if cast_uuid is not None:
+            stages.append([f"/cast-devices/{cast_uuid}/connect"])
+        stages.append([f"{prefix}/start"])
+
+        backoff = WATCHDOG_BACKOFF_MIN
+        try:
+            for attempt in range(1, WATCHDOG_MAX_ATTEMPTS + 1):
+                coordinator.stats.stream_recovery_attempts += 1
+                results = await coordinator.async_execute_batch(stages)
+                if all(results) and await coordinator.async_wait_for_state(
+                    is_stream_flowing, WATCHDOG_RECOVERY_TIMEOUT
+                ):
+                    self._async_recovered(stall_started, cast_uuid, attempt)
+                    return
+
+                _LOGGER.debug(
+                    "Recovery attempt %d of %d for %s failed",
+                    attempt, WATCHDOG_MAX_ATTEMPTS, coordinator.base_url,
+                )
+                if attempt < WATCHDOG_MAX_ATTEMPTS:
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, WATCHDOG_BACKOFF_MAX)
+                    if coordinator.data and is_stream_flowing(coordinator.data):
+                        # Audio came back while backing off
+                        self._async_recovered(stall_started, cast_uuid, attempt)
+                        return
+
+            coordinator.stats.stream_recovery_failures += 1
+            self._gave_up = True
+            _LOGGER.error(
+                "Could not recover the stream of %s after %d attempts",
+                coordinator.base_url, WATCHDOG_MAX_ATTEMPTS,
+            )
+            coordinator.hass.bus.async_fire(EVENT_STREAM_RECOVERY_FAILED, {
+                "config_entry_id": coordinator.entry_id,
+                "cast_device_uuid": cast_uuid,
+                "attempts": WATCHDOG_MAX_ATTEMPTS,
+            })
+        finally:
+            self._recovery_task = None
+
+    @callback
+    def _async_recovered(self, stall_started: float, cast_uuid: Optional[str], attempts: int) -> None:
+        """Record a recovered stream."""
+        coordinator = self._coordinator
+        duration = time.monotonic() - stall_started
+        coordinator.stats.stream_recoveries += 1
+        _LOGGER.info(
+            "Recovered the stream of %s after %d attempts, %.1fs after it stalled",
+            coordinator.base_url, attempts, duration,
+        )
+        coordinator.hass.bus.async_fire(EVENT_STREAM_RECOVERED, {
+            "config_entry_id": coordinator.entry_id,
+            "cast_device_uuid": cast_uuid,
+            "attempts": attempts,
+            "duration": round(duration, 1),
+        })
\ No newline at end of file